@@ -163,6 +163,10 @@ class ProjectConfig:
         }
     )
     agent_counts: dict[str, int] = field(default_factory=dict)
+    # ``create_team`` builds agents on a thread pool when True. Set to
+    # False to construct them serially (e.g. with non-thread-safe custom
+    # agent classes).
+    team_build_parallel: bool = True
     workflow: WorkflowConfig = field(default_factory=WorkflowConfig)
     session: SessionConfig = field(default_factory=SessionConfig)
     workspace: WorkspaceConfig = field(default_factory=WorkspaceConfig)
@@ -495,6 +499,7 @@ class ProjectConfig:
                 for name, cfg in self.agents.items()
             },
             "agent_counts": self.agent_counts,
+            "team_build_parallel": self.team_build_parallel,
             "workflow": {
                 "max_review_iterations": self.workflow.max_review_iterations,
                 "review_min_rounds": self.workflow.review_min_rounds,
@@ -680,6 +685,8 @@ class ProjectConfig:
         agent_counts = data.get("agent_counts", {})
         if isinstance(agent_counts, dict):
             config.agent_counts = {str(k): int(v) for k, v in agent_counts.items()}
+        if "team_build_parallel" in data:
+            config.team_build_parallel = bool(data["team_build_parallel"])
 
         workflow_data = data.get("workflow", {})
         if isinstance(workflow_data, dict):
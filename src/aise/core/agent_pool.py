@@ -0,0 +1,184 @@
+"""Pool of reusable agent instances shared across team builds.
+
+Constructing an agent allocates its LLM client and registers every
+skill. When several teams are built in one process (one per project
+in the web runtime), idle agents from finished projects can be handed
+to the next team instead of being rebuilt from scratch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from ..config import ModelConfig
+from ..utils.logging import get_logger
+from .agent import Agent, AgentRole
+from .artifact import ArtifactStore
+from .message import MessageBus
+
+logger = get_logger(__name__)
+
+PoolKey = tuple[AgentRole, tuple[object, ...]]
+
+
+def _pool_key(role: AgentRole, model_config: ModelConfig) -> PoolKey:
+    """Agents are interchangeable only when role and model settings match.
+
+    The API key is hashed so the plaintext never sits in a long-lived key,
+    and ``extra`` is sorted so equal configs match whatever their order.
+    """
+    return role, (
+        model_config.provider,
+        model_config.model,
+        model_config.base_url,
+        model_config.temperature,
+        model_config.max_tokens,
+        tuple(sorted((str(k), repr(v)) for k, v in model_config.extra.items())),
+        hashlib.sha256(model_config.api_key.encode("utf-8")).hexdigest(),
+    )
+
+
+@dataclass
+class AgentPoolEntry:
+    """Bookkeeping for a single pooled agent."""
+
+    agent: Agent
+    key: PoolKey
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    usage_count: int = 0
+    in_use: bool = False
+
+    @property
+    def idle_time(self) -> float:
+        return time.monotonic() - self.last_used
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.created_at
+
+
+class AgentPool:
+    """Hands out agents keyed by ``(role, model_config)`` and takes them back.
+
+    Acquired agents are renamed and rebound to the caller's message bus
+    and artifact store, so one instance can serve several orchestrators
+    over its lifetime (never two at once). ``max_size`` caps the number
+    of *idle* agents kept for reuse; agents in use are always tracked.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int = 32,
+        idle_timeout: float = 600.0,
+        max_agent_lifetime: float = 3600.0,
+    ) -> None:
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_agent_lifetime = max_agent_lifetime
+        self._entries: dict[int, AgentPoolEntry] = {}
+        self._idle = 0
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        role: AgentRole,
+        model_config: ModelConfig,
+        *,
+        agent_name: str,
+        message_bus: MessageBus,
+        artifact_store: ArtifactStore,
+        factory: Callable[[], Agent],
+    ) -> Agent:
+        """Return an idle pooled agent for ``role``/``model_config`` or build one.
+
+        The agent is named ``agent_name`` and subscribed to ``message_bus``
+        under that name. ``factory`` is only called on a pool miss; its
+        result is tracked so a later ``release`` returns it to the pool.
+        """
+        key = _pool_key(role, model_config)
+        with self._lock:
+            entry = self._take_idle(key)
+        if entry is None:
+            agent = factory()
+            entry = AgentPoolEntry(agent=agent, key=key, in_use=True)
+            with self._lock:
+                self._entries[id(agent)] = entry
+            # The constructor subscribed under its default name.
+            if agent.name != agent_name:
+                message_bus.unsubscribe(agent.name)
+                agent.name = agent_name
+                message_bus.subscribe(agent_name, agent.handle_message)
+            logger.debug("Agent pool miss: role=%s", role.value)
+        else:
+            agent = entry.agent
+            agent.name = agent_name
+            agent.message_bus = message_bus
+            agent.artifact_store = artifact_store
+            message_bus.subscribe(agent_name, agent.handle_message)
+            logger.debug("Agent pool hit: role=%s uses=%d", role.value, entry.usage_count)
+        entry.usage_count += 1
+        entry.last_used = time.monotonic()
+        return agent
+
+    def release(self, agent: Agent) -> None:
+        """Return ``agent`` to the pool. Unknown or already idle agents are ignored.
+
+        When ``max_size`` agents are already idle the agent is dropped
+        instead of kept.
+        """
+        with self._lock:
+            entry = self._entries.get(id(agent))
+            if entry is None or entry.agent is not agent or not entry.in_use:
+                return
+            agent.message_bus.unsubscribe(agent.name)
+            if self._idle >= self.max_size:
+                del self._entries[id(agent)]
+                return
+            entry.in_use = False
+            entry.last_used = time.monotonic()
+            self._idle += 1
+
+    def evict_idle(self) -> int:
+        """Drop idle entries past ``idle_timeout`` or ``max_agent_lifetime``.
+
+        Returns:
+            Number of evicted agents.
+        """
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if not entry.in_use and (entry.idle_time > self.idle_timeout or entry.age > self.max_agent_lifetime)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._idle -= len(stale)
+        if stale:
+            logger.info("Agent pool evicted idle agents: count=%d", len(stale))
+        return len(stale)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def idle_count(self) -> int:
+        with self._lock:
+            return self._idle
+
+    def _take_idle(self, key: PoolKey) -> AgentPoolEntry | None:
+        for entry in self._entries.values():
+            if entry.key == key and not entry.in_use:
+                if entry.age > self.max_agent_lifetime:
+                    continue
+                entry.in_use = True
+                self._idle -= 1
+                return entry
+        return None
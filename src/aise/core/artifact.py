@@ -6,7 +6,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any
+from typing import Any, Iterable
 
 
 class ArtifactType(Enum):
@@ -74,13 +74,28 @@ class ArtifactStore:
     def __init__(self) -> None:
         self._artifacts: dict[str, Artifact] = {}
         self._by_type: dict[ArtifactType, list[Artifact]] = {}
+        # Highest version per type, kept current by store() so get_latest is a lookup.
+        self._latest: dict[ArtifactType, Artifact] = {}
 
     def store(self, artifact: Artifact) -> str:
         """Store an artifact and return its ID."""
         self._artifacts[artifact.id] = artifact
         self._by_type.setdefault(artifact.artifact_type, []).append(artifact)
+        latest = self._latest.get(artifact.artifact_type)
+        # Strictly greater: on equal versions the earliest stored stays latest.
+        if latest is None or artifact.version > latest.version:
+            self._latest[artifact.artifact_type] = artifact
         return artifact.id
 
+    def store_many(self, artifacts: Iterable[Artifact]) -> list[str]:
+        """Store several artifacts in order and return their IDs.
+
+        Workflows that emit a batch of artifacts at the end of a run use this
+        single entry point, so a persistent backend can write them in one
+        transaction.
+        """
+        return [self.store(artifact) for artifact in artifacts]
+
     def get(self, artifact_id: str) -> Artifact | None:
         """Retrieve an artifact by ID."""
         return self._artifacts.get(artifact_id)
@@ -92,10 +107,15 @@ class ArtifactStore:
 
     def get_latest(self, artifact_type: ArtifactType) -> Artifact | None:
         """Get the latest version of an artifact type."""
-        artifacts = self._by_type.get(artifact_type)
-        if not artifacts:
-            return None
-        return max(artifacts, key=lambda a: a.version)
+        return self._latest.get(artifact_type)
+
+    def get_latest_many(self, artifact_types: Iterable[ArtifactType]) -> dict[ArtifactType, Artifact | None]:
+        """Get the latest version of several artifact types in one call.
+
+        Skills that read a fixed set of upstream artifacts use this single
+        entry point, so a persistent backend can serve it with one query.
+        """
+        return {artifact_type: self.get_latest(artifact_type) for artifact_type in artifact_types}
 
     def get_content(self, artifact_type: ArtifactType, key: str, default: Any = None) -> Any:
         """Get a content field from the latest artifact of a given type.
@@ -127,3 +147,4 @@ class ArtifactStore:
         """Clear all artifacts."""
         self._artifacts.clear()
         self._by_type.clear()
+        self._latest.clear()
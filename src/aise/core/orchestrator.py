@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 from ..utils.logging import get_logger
 from .agent import Agent, AgentRole
@@ -35,6 +35,12 @@ class Orchestrator:
         self._agents[agent.name] = agent
         logger.info("Agent registered: name=%s role=%s", agent.name, agent.role.value)
 
+    def register_agents(self, agents: Iterable[Agent]) -> None:
+        """Register several agents at once with a single summary log entry."""
+        batch = {agent.name: agent for agent in agents}
+        self._agents.update(batch)
+        logger.info("Agents registered: count=%d names=%s", len(batch), sorted(batch))
+
     def get_agent(self, name: str) -> Agent | None:
         return self._agents.get(name)
 
@@ -3,30 +3,52 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib
 import json
 import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Iterator
 
-from .agents import (
-    ArchitectAgent,
-    DeveloperAgent,
-    ProductManagerAgent,
-    ProjectManagerAgent,
-    QAEngineerAgent,
-    RDDirectorAgent,
-    ReviewerAgent,
-)
-from .config import ProjectConfig
+from .config import ModelConfig, ProjectConfig
 from .core.agent import AgentRole
-from .core.orchestrator import Orchestrator
 from .utils.logging import configure_logging
 
+if TYPE_CHECKING:
+    from .core.agent_pool import AgentPool
+    from .core.orchestrator import Orchestrator
+
+# Agent classes are imported on demand so lightweight CLI commands
+# (``--help``, ``web``, ``active_tasks`` ...) do not pay for loading
+# every agent and its skill tree before argparse even runs.
+_AGENT_MODULE_PATHS: dict[AgentRole, tuple[str, str]] = {
+    AgentRole.PRODUCT_MANAGER: ("aise.agents.product_manager", "ProductManagerAgent"),
+    AgentRole.ARCHITECT: ("aise.agents.architect", "ArchitectAgent"),
+    AgentRole.DEVELOPER: ("aise.agents.developer", "DeveloperAgent"),
+    AgentRole.QA_ENGINEER: ("aise.agents.qa_engineer", "QAEngineerAgent"),
+    AgentRole.PROJECT_MANAGER: ("aise.agents.project_manager", "ProjectManagerAgent"),
+    AgentRole.RD_DIRECTOR: ("aise.agents.rd_director", "RDDirectorAgent"),
+    AgentRole.REVIEWER: ("aise.agents.reviewer", "ReviewerAgent"),
+}
+
+# Default team: 1 agent per role (backward compatible). Reviewer is only
+# added in GitHub mode.
+_DEFAULT_AGENT_COUNTS = MappingProxyType({role: 1 for role in AgentRole if role != AgentRole.REVIEWER})
 
+_TEAM_BUILD_MAX_WORKERS = 8
+
+
+@functools.cache
 def _get_agent_class(role: AgentRole):
     """Map AgentRole to agent class constructor.
 
+    The agent module is imported the first time its role is requested;
+    the resolved class is cached so ``create_team`` loops pay a single
+    dict lookup per role afterwards.
+
     Args:
         role: The agent role
 
@@ -36,18 +58,11 @@ def _get_agent_class(role: AgentRole):
     Raises:
         ValueError: If role is unknown
     """
-    mapping = {
-        AgentRole.PRODUCT_MANAGER: ProductManagerAgent,
-        AgentRole.ARCHITECT: ArchitectAgent,
-        AgentRole.DEVELOPER: DeveloperAgent,
-        AgentRole.QA_ENGINEER: QAEngineerAgent,
-        AgentRole.PROJECT_MANAGER: ProjectManagerAgent,
-        AgentRole.RD_DIRECTOR: RDDirectorAgent,
-        AgentRole.REVIEWER: ReviewerAgent,
-    }
-    if role not in mapping:
-        raise ValueError(f"Unknown agent role: {role}")
-    return mapping[role]
+    try:
+        module_path, class_name = _AGENT_MODULE_PATHS[role]
+    except KeyError:
+        raise ValueError(f"Unknown agent role: {role}") from None
+    return getattr(importlib.import_module(module_path), class_name)
 
 
 def create_team(
@@ -55,6 +70,7 @@ def create_team(
     agent_counts: dict[AgentRole, int] | None = None,
     *,
     project_root: str | None = None,
+    agent_pool: AgentPool | None = None,
 ) -> Orchestrator:
     """Create a fully configured development team.
 
@@ -63,6 +79,9 @@ def create_team(
         agent_counts: Optional dict mapping AgentRole to count.
                      Default: 1 agent per role (backward compatible)
                      Example: {AgentRole.DEVELOPER: 3, AgentRole.QA_ENGINEER: 2}
+        agent_pool: Optional pool to draw idle agents from instead of
+                    constructing new ones. Callers release the agents
+                    back to the pool when the team is discarded.
 
     Returns:
         An Orchestrator with all agents registered and ready.
@@ -70,48 +89,64 @@ def create_team(
     config = config or ProjectConfig()
     configure_logging(config.logging)
 
-    # Default: 1 agent per role (backward compatible).
-    # Reviewer is only included in GitHub mode.
     if agent_counts is None:
-        agent_counts = {role: 1 for role in AgentRole if role != AgentRole.REVIEWER}
+        agent_counts = dict(_DEFAULT_AGENT_COUNTS)
         if config.is_github_mode:
             agent_counts[AgentRole.REVIEWER] = 1
 
+    from .core.orchestrator import Orchestrator
+
     orchestrator = Orchestrator(project_root=project_root)
     bus = orchestrator.message_bus
     store = orchestrator.artifact_store
 
-    # Create agents based on agent_counts
+    # Plan agents based on agent_counts (no construction yet)
+    plan: list[tuple[AgentRole, type, ModelConfig, str]] = []
     for role, count in agent_counts.items():
         if count < 1:
             continue  # Skip if count is 0 or negative
 
-        agent_class = _get_agent_class(role)
-
-        for i in range(1, count + 1):
-            # Generate agent name
-            if count == 1:
-                # Single agent: keep simple name for backward compatibility
-                agent_name = role.value
-            else:
-                # Multiple agents: use indexed names
-                agent_name = f"{role.value}_{i}"
+        # Check if agent is enabled in config before paying for construction
+        agent_config = config.agents.get(role.value)
+        if agent_config is not None and not agent_config.enabled:
+            continue
 
-            # Create agent instance
-            agent = agent_class(
+        agent_class = _get_agent_class(role)
+        model_config = config.get_model_config(role.value)
+        # Single agent keeps the plain role name for backward compatibility;
+        # multiple agents use indexed names.
+        if count == 1:
+            agent_names = [role.value]
+        else:
+            agent_names = [f"{role.value}_{i}" for i in range(1, count + 1)]
+        plan.extend((role, agent_class, model_config, agent_name) for agent_name in agent_names)
+
+    def _build_agent(entry: tuple[AgentRole, type, ModelConfig, str]):
+        role, agent_class, model_config, agent_name = entry
+        # Reuse a pooled agent when possible; the pool names and subscribes it.
+        if agent_pool is not None:
+            return agent_pool.acquire(
+                role,
+                model_config,
+                agent_name=agent_name,
                 message_bus=bus,
                 artifact_store=store,
-                model_config=config.get_model_config(role.value),
+                factory=lambda: agent_class(message_bus=bus, artifact_store=store, model_config=model_config),
             )
+        agent = agent_class(message_bus=bus, artifact_store=store, model_config=model_config)
+        # Override agent name
+        agent.name = agent_name
+        return agent
+
+    # Construction loads skills and builds an LLM client per agent, so
+    # fan it out; ``map`` keeps registration order identical to the plan.
+    if config.team_build_parallel and len(plan) > 1:
+        with ThreadPoolExecutor(max_workers=min(_TEAM_BUILD_MAX_WORKERS, len(plan))) as executor:
+            agents_to_register = list(executor.map(_build_agent, plan))
+    else:
+        agents_to_register = [_build_agent(entry) for entry in plan]
 
-            # Override agent name
-            agent.name = agent_name
-
-            # Check if agent is enabled in config
-            agent_config = config.agents.get(role.value)
-            if agent_config is None or agent_config.enabled:
-                orchestrator.register_agent(agent)
-
+    orchestrator.register_agents(agents_to_register)
     return orchestrator
 
 
@@ -160,19 +195,100 @@ def _project_root_for(project_name: str) -> Path:
     return pdir
 
 
+# Longer or multi-line values cannot be a sensible path; skip the filesystem probe.
+_MAX_REQUIREMENTS_PATH_LEN = 4096
+
+
 def _read_requirements_arg(value: str | None) -> str | None:
     """Resolve a ``--requirements`` CLI value to text.
 
     Treats the value as a file path first; falls back to raw text if the
-    path does not exist or is unreadable.
+    path does not exist or is unreadable. Probes with ``os.path.isfile``
+    rather than catching ``open()`` failures so the common raw-text case
+    costs one ``stat`` instead of a raised exception, and multi-line or
+    over-long values (inline requirement text) skip the probe entirely.
     """
     if not value:
         return None
+    if (
+        len(value) < _MAX_REQUIREMENTS_PATH_LEN
+        and "\n" not in value
+        and os.path.isfile(value)
+        and os.access(value, os.R_OK)
+    ):
+        return Path(value).read_text()
+    return value
+
+
+def _iter_json_chunks(payload: dict, dumps) -> Iterator[bytes]:
+    """Yield ``payload`` as indent-2 JSON, one top-level value / list item at a time.
+
+    ``dumps`` encodes a single value to indent-2 bytes; nested output is
+    re-indented to its depth (JSON strings never contain raw newlines).
+    With orjson as ``dumps`` the bytes match ``json.dumps(payload, indent=2,
+    ensure_ascii=False, default=str)`` for str, int, bool, None, list, dict,
+    str/int Enum and default-rendered values, with these known differences:
+
+    * NaN and Infinity become ``null`` (stdlib: ``NaN``/``Infinity``).
+    * Plain ``Enum`` members are written by value (stdlib: ``str(member)``).
+    * Float exponents have no zero padding (``1e-7``; stdlib: ``1e-07``).
+    """
+    if not payload:
+        yield b"{}"
+        return
+    yield b"{"
+    for i, (key, value) in enumerate(payload.items()):
+        yield (b",\n  " if i else b"\n  ") + dumps(str(key)) + b": "
+        if isinstance(value, list) and value:
+            yield b"["
+            for j, item in enumerate(value):
+                yield (b",\n    " if j else b"\n    ") + dumps(item).replace(b"\n", b"\n    ")
+            yield b"\n  ]"
+        else:
+            yield dumps(value).replace(b"\n", b"\n  ")
+    yield b"\n}"
+
+
+def _write_results_json(path: str, payload: dict) -> None:
+    """Write ``payload`` as indented JSON to ``path``.
+
+    Uses ``orjson`` when installed (optional, ``pip install orjson``),
+    encoding and writing one top-level value or list item at a time so
+    only the largest single entry (e.g. one task-log message) is held as
+    bytes. Otherwise, or when orjson rejects a value (e.g. integers
+    beyond 64 bits), falls back to ``json.dump``, which streams
+    ``iterencode`` chunks through a 64 KiB write buffer. The two paths
+    differ for non-finite floats, plain Enums and float exponents; see
+    ``_iter_json_chunks``.
+    """
     try:
-        with open(value) as f:
-            return f.read()
-    except (FileNotFoundError, IsADirectoryError, PermissionError):
-        return value
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+        # Passthrough keeps datetimes/dataclasses on ``default=str`` so
+        # both encoders render them the same way.
+        options = (
+            orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+        def _dumps(value: Any) -> bytes:
+            return orjson.dumps(value, default=str, option=options)
+
+        try:
+            with open(path, "wb", buffering=1 << 16) as f:
+                for chunk in _iter_json_chunks(payload, _dumps):
+                    f.write(chunk)
+            return
+        except orjson.JSONEncodeError:
+            pass  # rewrite the whole file with the stdlib encoder below
+
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        json.dump(payload, f, indent=2, default=str, ensure_ascii=False)
 
 
 def _multi_project_repl(config: ProjectConfig) -> None:
@@ -274,21 +390,35 @@ def start_web_app(
     uvicorn.run(create_app(), host=host, port=port, reload=reload)
 
 
+_GITHUB_ENV_VARS = ("GITHUB_TOKEN", "GITHUB_REPO_OWNER", "GITHUB_REPO_NAME")
+
+
+@functools.cache
+def _github_env_defaults() -> dict[str, str]:
+    """Read the GitHub env vars once per process.
+
+    Tests that monkeypatch the environment call
+    ``_github_env_defaults.cache_clear()`` (and ``_build_parser.cache_clear()``).
+    """
+    return {name: os.environ.get(name, "") for name in _GITHUB_ENV_VARS}
+
+
 def _add_github_args(sub_parser: argparse.ArgumentParser) -> None:
-    """Add GitHub token / repo CLI arguments to a sub-parser."""
+    """Add GitHub token / repo CLI arguments to a (parent) parser."""
+    env = _github_env_defaults()
     sub_parser.add_argument(
         "--github-token",
-        default=os.environ.get("GITHUB_TOKEN", ""),
+        default=env["GITHUB_TOKEN"],
         help="GitHub personal access token (env: GITHUB_TOKEN)",
     )
     sub_parser.add_argument(
         "--github-repo-owner",
-        default=os.environ.get("GITHUB_REPO_OWNER", ""),
+        default=env["GITHUB_REPO_OWNER"],
         help="GitHub repository owner (env: GITHUB_REPO_OWNER)",
     )
     sub_parser.add_argument(
         "--github-repo-name",
-        default=os.environ.get("GITHUB_REPO_NAME", ""),
+        default=env["GITHUB_REPO_NAME"],
         help="GitHub repository name (env: GITHUB_REPO_NAME)",
     )
 
@@ -320,127 +450,157 @@ def _load_cli_project_config(project_name: str) -> ProjectConfig:
     return ProjectConfig(project_name=project_name)
 
 
-def main() -> None:
-    """CLI entry point."""
-    configure_logging(_load_cli_project_config("Untitled Project").logging)
-    parser = argparse.ArgumentParser(
-        description="AISE - Multi-Agent Software Development Team",
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
-
-    # run command
-    run_parser = subparsers.add_parser("run", help="Run the development workflow")
-    run_parser.add_argument("--requirements", "-r", required=True, help="Requirements text or file path")
-    run_parser.add_argument("--project-name", "-p", default="My Project", help="Project name")
-    run_parser.add_argument("--output", "-o", help="Output file for results (JSON)")
-    _add_github_args(run_parser)
+_WEB_URL_ARG = (
+    ("--web-url",),
+    {
+        "default": "http://127.0.0.1:8000",
+        "help": "Base URL of the running aise web server (default: http://127.0.0.1:8000)",
+    },
+)
 
-    # demand command
-    demand_parser = subparsers.add_parser(
+# Declarative sub-command table consumed by ``_build_parser``. Each entry
+# is ``(name, help, uses_github_args, ((flags, add_argument_kwargs), ...))``.
+_CLI_SCHEMA: tuple[tuple[str, str, bool, tuple[tuple[tuple[str, ...], dict], ...]], ...] = (
+    (
+        "run",
+        "Run the development workflow",
+        True,
+        (
+            (("--requirements", "-r"), {"required": True, "help": "Requirements text or file path"}),
+            (("--project-name", "-p"), {"default": "My Project", "help": "Project name"}),
+            (("--output", "-o"), {"help": "Output file for results (JSON)"}),
+        ),
+    ),
+    (
         "demand",
-        help="Start an interactive on-demand session",
-    )
-    demand_parser.add_argument("--project-name", "-p", default="My Project", help="Project name")
-    demand_parser.add_argument(
-        "--requirements",
-        "-r",
-        help="Requirement text or path to a file containing it. If omitted, the requirement is read from stdin.",
-    )
-    _add_github_args(demand_parser)
-
-    # team command
-    team_parser = subparsers.add_parser("team", help="Show team information")
-    team_parser.add_argument("--verbose", "-v", action="store_true", help="Show agent skills")
-
-    # multi-project command
-    subparsers.add_parser(
+        "Start an interactive on-demand session",
+        True,
+        (
+            (("--project-name", "-p"), {"default": "My Project", "help": "Project name"}),
+            (
+                ("--requirements", "-r"),
+                {
+                    "help": "Requirement text or path to a file containing it. "
+                    "If omitted, the requirement is read from stdin.",
+                },
+            ),
+        ),
+    ),
+    (
+        "team",
+        "Show team information",
+        False,
+        ((("--verbose", "-v"), {"action": "store_true", "help": "Show agent skills"}),),
+    ),
+    (
         "multi-project",
-        help="Interactive multi-project REPL backed by ProjectSession (create/list/switch/run)",
-    )
-
-    # web command
-    web_parser = subparsers.add_parser(
+        "Interactive multi-project REPL backed by ProjectSession (create/list/switch/run)",
+        False,
+        (),
+    ),
+    (
         "web",
-        help="Start web project management system",
-    )
-    web_parser.add_argument("--host", default="127.0.0.1", help="Host for web server")
-    web_parser.add_argument("--port", type=int, default=8000, help="Port for web server")
-    web_parser.add_argument("--reload", action="store_true", help="Enable auto reload")
-
-    retry_parser = subparsers.add_parser(
+        "Start web project management system",
+        False,
+        (
+            (("--host",), {"default": "127.0.0.1", "help": "Host for web server"}),
+            (("--port",), {"type": int, "default": 8000, "help": "Port for web server"}),
+            (("--reload",), {"action": "store_true", "help": "Enable auto reload"}),
+        ),
+    ),
+    (
         "task-retry",
-        help="Retry a single workflow task in a web-managed project run",
-    )
-    retry_parser.add_argument("--project-id", required=True, help="Project ID")
-    retry_parser.add_argument("--run-id", required=True, help="Run ID")
-    retry_parser.add_argument("--phase", required=True, help="Phase key")
-    retry_parser.add_argument("--task-key", required=True, help="Task key from run detail UI")
-    retry_parser.add_argument("--mode", choices=["current", "downstream"], default="current", help="Retry mode")
-    retry_parser.add_argument("--wait", action="store_true", help="Wait for completion")
-    retry_parser.add_argument("--poll-interval", type=float, default=2.0, help="Polling interval seconds")
-    retry_parser.add_argument("--show-task-state", action="store_true", help="Print task memory state after completion")
-
+        "Retry a single workflow task in a web-managed project run",
+        False,
+        (
+            (("--project-id",), {"required": True, "help": "Project ID"}),
+            (("--run-id",), {"required": True, "help": "Run ID"}),
+            (("--phase",), {"required": True, "help": "Phase key"}),
+            (("--task-key",), {"required": True, "help": "Task key from run detail UI"}),
+            (("--mode",), {"choices": ["current", "downstream"], "default": "current", "help": "Retry mode"}),
+            (("--wait",), {"action": "store_true", "help": "Wait for completion"}),
+            (("--poll-interval",), {"type": float, "default": 2.0, "help": "Polling interval seconds"}),
+            (("--show-task-state",), {"action": "store_true", "help": "Print task memory state after completion"}),
+        ),
+    ),
     # waterfall_v2: resume a halted run
-    resume_parser = subparsers.add_parser(
+    (
         "resume_project",
-        help="Resume a waterfall_v2 project that halted at a phase failure",
-    )
-    resume_parser.add_argument("project_id", help="Project ID to resume")
-    resume_parser.add_argument(
-        "--web-url",
-        default="http://127.0.0.1:8000",
-        help="Base URL of the running aise web server (default: http://127.0.0.1:8000)",
-    )
-
+        "Resume a waterfall_v2 project that halted at a phase failure",
+        False,
+        ((("project_id",), {"help": "Project ID to resume"}), _WEB_URL_ARG),
+    ),
     # waterfall_v2: abort a running task
-    abort_parser = subparsers.add_parser(
+    (
         "abort_task",
-        help="Send an abort signal to a running task in the aise web server",
-    )
-    abort_parser.add_argument("task_id", help="Task ID to abort (from /api/tasks/active)")
-    abort_parser.add_argument(
-        "--web-url",
-        default="http://127.0.0.1:8000",
-        help="Base URL of the running aise web server (default: http://127.0.0.1:8000)",
-    )
-
+        "Send an abort signal to a running task in the aise web server",
+        False,
+        ((("task_id",), {"help": "Task ID to abort (from /api/tasks/active)"}), _WEB_URL_ARG),
+    ),
     # waterfall_v2: list active tasks (no LLM impact, just observability)
-    active_parser = subparsers.add_parser(
+    (
         "active_tasks",
-        help="List in-flight tasks tracked by the aise web server",
-    )
-    active_parser.add_argument(
-        "--web-url",
-        default="http://127.0.0.1:8000",
-        help="Base URL of the running aise web server (default: http://127.0.0.1:8000)",
-    )
-
+        "List in-flight tasks tracked by the aise web server",
+        False,
+        (_WEB_URL_ARG,),
+    ),
     # waterfall_v2: phase-contract test (single-phase iteration loop)
-    phase_test_parser = subparsers.add_parser(
+    (
         "v2-phase-test",
-        help="Run a single waterfall_v2 phase against a frozen input snapshot + assertion list",
-    )
-    phase_test_parser.add_argument(
-        "--case",
-        required=True,
-        help="Path to a phase-test case YAML (see aise.testing.phase_test docstring)",
-    )
-    phase_test_parser.add_argument(
-        "--keep-workdir",
-        action="store_true",
-        help="Keep the temp project root after the run (path printed in report)",
+        "Run a single waterfall_v2 phase against a frozen input snapshot + assertion list",
+        False,
+        (
+            (
+                ("--case",),
+                {"required": True, "help": "Path to a phase-test case YAML (see aise.testing.phase_test docstring)"},
+            ),
+            (
+                ("--keep-workdir",),
+                {"action": "store_true", "help": "Keep the temp project root after the run (path printed in report)"},
+            ),
+        ),
+    ),
+)
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser from ``_CLI_SCHEMA``.
+
+    Cached so repeated ``main()`` calls in one process (tests, embedding
+    callers) reuse the same sub-parser tree instead of rebuilding it.
+    """
+    parser = argparse.ArgumentParser(
+        description="AISE - Multi-Agent Software Development Team",
     )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Shared --github-* arguments, inherited via ``parents=``
+    github_parent = argparse.ArgumentParser(add_help=False)
+    _add_github_args(github_parent)
 
+    for name, help_text, uses_github_args, arguments in _CLI_SCHEMA:
+        sub_parser = subparsers.add_parser(
+            name,
+            parents=[github_parent] if uses_github_args else [],
+            help=help_text,
+        )
+        for flags, kwargs in arguments:
+            sub_parser.add_argument(*flags, **kwargs)
+
+    return parser
+
+
+def main() -> None:
+    """CLI entry point."""
+    configure_logging(_load_cli_project_config("Untitled Project").logging)
+    parser = _build_parser()
     args = parser.parse_args()
 
     if args.command == "run":
-        requirements = args.requirements
-        # Check if it's a file path
-        try:
-            with open(requirements) as f:
-                requirements = f.read()
-        except (FileNotFoundError, IsADirectoryError, PermissionError):
-            pass  # Use as raw text
+        requirements = _read_requirements_arg(args.requirements)
+        if requirements is None:
+            requirements = args.requirements
 
         config = _load_cli_project_config(args.project_name)
         _apply_github_config(args, config)
@@ -463,18 +623,18 @@ def main() -> None:
                 "result": result,
                 "task_log": session.task_log,
             }
-            with open(args.output, "w") as f:
-                json.dump(output, f, indent=2, default=str, ensure_ascii=False)
+            _write_results_json(args.output, output)
             print(f"Results written to {args.output}")
         else:
-            print(result)
+            lines = [str(result)]
             if session.task_log:
-                print(f"\n--- A2A task log: {len(session.task_log)} messages ---")
+                lines.append(f"\n--- A2A task log: {len(session.task_log)} messages ---")
                 for msg in session.task_log:
                     direction = "->" if msg["type"] == "task_request" else "<-"
                     agent = msg.get("to") if msg["type"] == "task_request" else msg.get("from")
                     status = msg.get("status", "")
-                    print(f"  {direction} {agent} [{msg['type']}] {status}")
+                    lines.append(f"  {direction} {agent} [{msg['type']}] {status}")
+            print("\n".join(lines))
 
         manager.stop()
 
@@ -518,22 +678,19 @@ def main() -> None:
 
         from .runtime import RuntimeManager
 
-        manager = RuntimeManager(config=config)
-        manager.start()
-
-        print("AISE Development Team (Runtime)")
-        print("=" * 40)
-        for status in manager.get_agents_status():
+        # Display-only: describe agents from their definitions instead of
+        # starting runtimes (which would build an LLM client per agent).
+        lines = ["AISE Development Team (Runtime)", "=" * 40]
+        for status in RuntimeManager(config=config).describe_agents():
             card = status.get("agent_card", {})
-            print(f"\n{status['role_display']}: {status['name']}  [{status['status']}]")
+            lines.append(f"\n{status['role_display']}: {status['name']}  [{status['status']}]")
             model = status.get("model", {})
             if model.get("model"):
-                print(f"  Model: {model.get('provider', '')}/{model['model']}")
+                lines.append(f"  Model: {model.get('provider', '')}/{model['model']}")
             if args.verbose:
                 for skill in card.get("skills", []):
-                    print(f"  - {skill['id']}: {skill.get('description', '')}")
-
-        manager.stop()
+                    lines.append(f"  - {skill['id']}: {skill.get('description', '')}")
+        print("\n".join(lines))
 
     elif args.command == "multi-project":
         config = _load_cli_project_config("Multi Project Session")
@@ -567,6 +724,8 @@ def main() -> None:
             f"run={args.run_id} phase={args.phase} task={args.task_key} mode={args.mode}"
         )
         if args.wait:
+            import time
+
             poll_interval = args.poll_interval if args.poll_interval > 0 else 2.0
             while True:
                 run = service.get_run(args.project_id, args.run_id)
@@ -23,7 +23,7 @@ from ..config import ModelConfig, ProjectConfig
 from ..utils.logging import get_logger
 from .agent_runtime import AgentRuntime
 from .llm_factory import build_llm as _factory_build_llm
-from .models import AgentState
+from .models import AgentCard, AgentState
 from .runtime_config import LLMDefaults
 
 logger = get_logger(__name__)
@@ -101,32 +101,41 @@ class RuntimeManager:
         """
         result: list[dict[str, Any]] = []
         for name, rt in self._runtimes.items():
-            card = rt.agent_card
-            card_dict = card.to_dict()
-            defn = rt.definition
-
-            # Enrich card with model details from the definition metadata
-            model_info = defn.metadata.get("_model_info", {})
-
-            result.append(
-                {
-                    "agent_id": f"runtime__{name}",
-                    "name": name,
-                    "role": name,
-                    "role_display": card.name.replace("_", " ").title() if card.name else name,
-                    "project_id": "",
-                    "project_name": "",
-                    "source": "runtime",
-                    "model": model_info,
-                    "skills": [s.id for s in card.skills],
-                    "status": _map_state(rt.state),
-                    "current_task": rt.current_task,
-                    "agent_card": {
-                        **card_dict,
-                        "model": model_info,
-                    },
-                }
-            )
+            # Model details are stashed on the definition metadata at init
+            model_info = rt.definition.metadata.get("_model_info", {})
+            result.append(_status_entry(name, rt.agent_card, model_info, _map_state(rt.state), rt.current_task))
+        return result
+
+    def describe_agents(self) -> list[dict[str, Any]]:
+        """Return the same entries as :meth:`get_agents_status` without starting.
+
+        Parses each agent.md and builds its card, but constructs no LLM
+        client or deep agent — for display-only callers such as
+        ``aise team``. Agents are reported as ``standby``, the state they
+        enter once started.
+        """
+        from .agent_card import build_agent_card
+        from .agent_md_parser import parse_agent_md
+        from .skill_loader import load_skills_from_directory
+
+        md_files = _discover_agent_md_files()
+        skills_dir = _agents_dir() / "_runtime_skills"
+        _, extra_skills = load_skills_from_directory(skills_dir) if md_files else ([], [])
+
+        result: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        for md_path in md_files:
+            try:
+                defn = parse_agent_md(md_path)
+            except Exception as exc:
+                logger.error("Failed to parse agent definition %s: %s", md_path.name, exc)
+                continue
+            if defn.name in seen:
+                continue
+            seen.add(defn.name)
+            model_cfg = self._config.get_model_config(defn.name)
+            card = build_agent_card(defn, extra_skills=extra_skills)
+            result.append(_status_entry(defn.name, card, _model_info(model_cfg), "standby", None))
         return result
 
     # -- Internal ------------------------------------------------------------
@@ -157,12 +166,7 @@ class RuntimeManager:
         )
 
         # Stash model info so the Monitor can display it
-        rt.definition.metadata["_model_info"] = {
-            "provider": model_cfg.provider,
-            "model": model_cfg.model,
-            "temperature": model_cfg.temperature,
-            "maxTokens": model_cfg.max_tokens,
-        }
+        rt.definition.metadata["_model_info"] = _model_info(model_cfg)
 
         rt.evoke()
         self._runtimes[agent_name] = rt
@@ -176,6 +180,43 @@ class RuntimeManager:
         )
 
 
+def _model_info(model_cfg: ModelConfig) -> dict[str, Any]:
+    """Model details shown by the Monitor API and ``aise team``."""
+    return {
+        "provider": model_cfg.provider,
+        "model": model_cfg.model,
+        "temperature": model_cfg.temperature,
+        "maxTokens": model_cfg.max_tokens,
+    }
+
+
+def _status_entry(
+    name: str,
+    card: AgentCard,
+    model_info: dict[str, Any],
+    status: str,
+    current_task: Any,
+) -> dict[str, Any]:
+    """Build one Monitor API agent entry from an agent card."""
+    return {
+        "agent_id": f"runtime__{name}",
+        "name": name,
+        "role": name,
+        "role_display": card.name.replace("_", " ").title() if card.name else name,
+        "project_id": "",
+        "project_name": "",
+        "source": "runtime",
+        "model": model_info,
+        "skills": [s.id for s in card.skills],
+        "status": status,
+        "current_task": current_task,
+        "agent_card": {
+            **card.to_dict(),
+            "model": model_info,
+        },
+    }
+
+
 def _discover_agent_md_files() -> list[Path]:
     """Scan ``aise/agents/`` for ``*.md`` agent definition files."""
     agents_path = _agents_dir()
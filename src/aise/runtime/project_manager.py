@@ -31,6 +31,7 @@ from typing import TYPE_CHECKING, Any
 
 from ..config import ProjectConfig
 from ..core.agent import AgentRole
+from ..core.agent_pool import AgentPool
 from ..core.project import Project, ProjectStatus
 from ..utils.logging import get_logger
 
@@ -60,6 +61,9 @@ class ProjectManager:
         self._projects_root = Path(projects_root).resolve()
         self._global_config_path = Path(global_config_path).resolve()
         self._global_config = self._load_global_config()
+        # Agents of deleted projects go back here and are reused by the
+        # next ``create_project`` with the same role + model settings.
+        self._agent_pool = AgentPool()
         logger.info(
             "ProjectManager initialized: projects_root=%s global_config=%s",
             self._projects_root,
@@ -110,7 +114,8 @@ class ProjectManager:
         # Import locally to avoid circular dependency
         from ..main import create_team
 
-        orchestrator = create_team(config, agent_counts)
+        self._agent_pool.evict_idle()
+        orchestrator = create_team(config, agent_counts, agent_pool=self._agent_pool)
         orchestrator.project_root = str(project_root)
 
         # Create project container
@@ -207,6 +212,9 @@ class ProjectManager:
             project = self._projects[project_id]
             # Archive before deletion for cleanup
             project.archive()
+            if project.orchestrator is not None:
+                for agent in project.orchestrator.agents.values():
+                    self._agent_pool.release(agent)
             del self._projects[project_id]
             return True
         return False
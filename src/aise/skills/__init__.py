@@ -1,67 +1,62 @@
-"""All agent skills."""
+"""All agent skills.
 
-from .api_design import APIDesignSkill
-from .architecture_document_generation import ArchitectureDocumentGenerationSkill
-from .architecture_requirement import ArchitectureRequirementSkill
-from .architecture_review import ArchitectureReviewSkill
-from .bug_fix import BugFixSkill
-from .code_generation import CodeGenerationSkill
-from .code_review import CodeReviewSkill
-from .conflict_resolution import ConflictResolutionSkill
-from .deep_architecture_workflow import DeepArchitectureWorkflowSkill
-from .deep_product_workflow import DeepProductWorkflowSkill
-from .document_generation import DocumentGenerationSkill
-from .functional_design import FunctionalDesignSkill
-from .pr_merge import PRMergeSkill
-from .pr_review import PRReviewSkill
-from .pr_submission import PRSubmissionSkill
-from .product_design import ProductDesignSkill
-from .product_review import ProductReviewSkill
-from .progress_tracking import ProgressTrackingSkill
-from .requirement_analysis import RequirementAnalysisSkill
-from .requirement_distribution import RequirementDistributionSkill
-from .status_tracking import StatusTrackingSkill
-from .system_design import SystemDesignSkill
-from .system_feature_analysis import SystemFeatureAnalysisSkill
-from .system_requirement_analysis import SystemRequirementAnalysisSkill
-from .team_formation import TeamFormationSkill
-from .tech_stack_selection import TechStackSelectionSkill
-from .test_automation import TestAutomationSkill
-from .test_case_design import TestCaseDesignSkill
-from .test_plan_design import TestPlanDesignSkill
-from .test_review import TestReviewSkill
-from .user_story_writing import UserStoryWritingSkill
+Skill classes are resolved lazily (PEP 562) so importing ``aise.skills``
+does not load every skill package; each class is imported on first
+attribute access and then cached in the module globals.
+"""
 
-__all__ = [
-    "RequirementAnalysisSkill",
-    "UserStoryWritingSkill",
-    "ProductDesignSkill",
-    "ProductReviewSkill",
-    "SystemFeatureAnalysisSkill",
-    "SystemRequirementAnalysisSkill",
-    "DocumentGenerationSkill",
-    "SystemDesignSkill",
-    "APIDesignSkill",
-    "ArchitectureReviewSkill",
-    "TechStackSelectionSkill",
-    "ArchitectureRequirementSkill",
-    "FunctionalDesignSkill",
-    "StatusTrackingSkill",
-    "ArchitectureDocumentGenerationSkill",
-    "CodeGenerationSkill",
-    "CodeReviewSkill",
-    "BugFixSkill",
-    "TestPlanDesignSkill",
-    "TestCaseDesignSkill",
-    "TestAutomationSkill",
-    "TestReviewSkill",
-    "ConflictResolutionSkill",
-    "DeepArchitectureWorkflowSkill",
-    "DeepProductWorkflowSkill",
-    "ProgressTrackingSkill",
-    "TeamFormationSkill",
-    "RequirementDistributionSkill",
-    "PRReviewSkill",
-    "PRSubmissionSkill",
-    "PRMergeSkill",
-]
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_LAZY: dict[str, str] = {
+    "APIDesignSkill": ".api_design",
+    "ArchitectureDocumentGenerationSkill": ".architecture_document_generation",
+    "ArchitectureRequirementSkill": ".architecture_requirement",
+    "ArchitectureReviewSkill": ".architecture_review",
+    "BugFixSkill": ".bug_fix",
+    "CodeGenerationSkill": ".code_generation",
+    "CodeReviewSkill": ".code_review",
+    "ConflictResolutionSkill": ".conflict_resolution",
+    "DeepArchitectureWorkflowSkill": ".deep_architecture_workflow",
+    "DeepProductWorkflowSkill": ".deep_product_workflow",
+    "DocumentGenerationSkill": ".document_generation",
+    "FunctionalDesignSkill": ".functional_design",
+    "PRMergeSkill": ".pr_merge",
+    "PRReviewSkill": ".pr_review",
+    "PRSubmissionSkill": ".pr_submission",
+    "ProductDesignSkill": ".product_design",
+    "ProductReviewSkill": ".product_review",
+    "ProgressTrackingSkill": ".progress_tracking",
+    "RequirementAnalysisSkill": ".requirement_analysis",
+    "RequirementDistributionSkill": ".requirement_distribution",
+    "StatusTrackingSkill": ".status_tracking",
+    "SystemDesignSkill": ".system_design",
+    "SystemFeatureAnalysisSkill": ".system_feature_analysis",
+    "SystemRequirementAnalysisSkill": ".system_requirement_analysis",
+    "TeamFormationSkill": ".team_formation",
+    "TechStackSelectionSkill": ".tech_stack_selection",
+    "TestAutomationSkill": ".test_automation",
+    "TestCaseDesignSkill": ".test_case_design",
+    "TestPlanDesignSkill": ".test_plan_design",
+    "TestReviewSkill": ".test_review",
+    "UserStoryWritingSkill": ".user_story_writing",
+}
+
+# ``_LAZY`` is the single registry of exported skills.
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
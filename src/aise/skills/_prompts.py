@@ -0,0 +1,19 @@
+"""Prompt file loading shared by the LLM-backed skills."""
+
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+
+
+@functools.lru_cache(maxsize=64)
+def load_prompt_file(script_file: str, relative_path: str) -> str:
+    """Read a packaged prompt file relative to ``script_file``'s directory.
+
+    Each file is read once per process; missing files read as empty.
+    """
+    path = Path(script_file).resolve().parent / relative_path
+    try:
+        return path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
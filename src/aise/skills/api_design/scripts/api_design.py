@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import json
 import re
-from pathlib import Path
+import sys
 from typing import Any
 
 from ....core.artifact import Artifact, ArtifactType
 from ....core.skill import Skill, SkillContext
+from ..._prompts import load_prompt_file
+
+_BODY_METHODS = frozenset({"post", "put", "patch"})
+
+# A JSON object wrapped in a Markdown code fence, optionally tagged ``json``.
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
 
 
 class APIDesignSkill(Skill):
@@ -23,8 +29,7 @@ class APIDesignSkill(Skill):
         return "Design API contracts (endpoints, request/response schemas, error codes)"
 
     def execute(self, input_data: dict[str, Any], context: SkillContext) -> Artifact:
-        components = context.artifact_store.get_content(ArtifactType.ARCHITECTURE_DESIGN, "components", [])
-        llm_contract = self._design_with_llm(components, context)
+        llm_contract = self._design_with_llm(self._service_components(context), context)
         return Artifact(
             artifact_type=ArtifactType.API_CONTRACT,
             content=llm_contract,
@@ -33,24 +38,25 @@ class APIDesignSkill(Skill):
         )
 
     @staticmethod
-    def _pluralize(word: str) -> str:
-        """Naive English pluralization that handles common suffixes."""
-        if word.endswith(("s", "sh", "ch", "x", "z")):
-            return word + "es"
-        if word.endswith("y") and len(word) > 1 and word[-2] not in "aeiou":
-            return word[:-1] + "ies"
-        return word + "s"
+    def _service_components(context: SkillContext) -> list[dict[str, Any]] | None:
+        """Service components of the latest architecture design.
+
+        Returns ``None`` when the design has no ``components`` list.
+        """
+        components = context.artifact_store.get_content(ArtifactType.ARCHITECTURE_DESIGN, "components", [])
+        if not isinstance(components, list):
+            return None
+        return [c for c in components if isinstance(c, dict) and c.get("type") == "service"]
 
     def _design_with_llm(
         self,
-        components: Any,
+        services: list[dict[str, Any]] | None,
         context: SkillContext,
     ) -> dict[str, Any]:
         if context.llm_client is None:
             raise RuntimeError("LLM client is required for api_design")
-        if not isinstance(components, list):
+        if services is None:
             raise ValueError("Architecture components are required for api_design")
-        services = [c for c in components if isinstance(c, dict) and c.get("type") == "service"]
         if not services:
             raise ValueError("No service components available for api_design")
 
@@ -85,6 +91,10 @@ class APIDesignSkill(Skill):
             raise RuntimeError("LLM response contains no valid endpoints for api_design")
 
         schemas = parsed.get("schemas")
+        if not isinstance(schemas, dict):
+            # Accept the OpenAPI placement too, mirroring the contract we emit.
+            components = parsed.get("components")
+            schemas = components.get("schemas") if isinstance(components, dict) else None
         if not isinstance(schemas, dict):
             schemas = {}
         paths = self._build_paths_from_endpoints(endpoints)
@@ -100,12 +110,19 @@ class APIDesignSkill(Skill):
             ),
             "paths": paths,
             "components": {"schemas": schemas, "securitySchemes": {"bearerAuth": {"type": "http", "scheme": "bearer"}}},
+            # Schemas live only under ``components.schemas``; a top-level
+            # alias made serialised contracts carry the subtree twice.
             "endpoints": endpoints,
-            "schemas": schemas,
             "analysis_mode": "llm",
         }
 
     def _normalise_endpoints(self, value: Any) -> list[dict[str, Any]]:
+        """Validate LLM endpoint rows into string-typed endpoint dicts.
+
+        Paths and status code/text strings repeat across rows (one path per
+        method, the same "200"/"Success" everywhere), so they are interned
+        and shared by ``endpoints`` and the ``paths`` view built from them.
+        """
         if not isinstance(value, list):
             return []
         rows: list[dict[str, Any]] = []
@@ -113,7 +130,7 @@ class APIDesignSkill(Skill):
             if not isinstance(item, dict):
                 continue
             method = str(item.get("method", "")).upper().strip()
-            path = str(item.get("path", "")).strip()
+            path = sys.intern(str(item.get("path", "")).strip())
             desc = str(item.get("description", "")).strip()
             status_codes = item.get("status_codes", {})
             if method not in {"GET", "POST", "PUT", "DELETE", "PATCH"}:
@@ -127,39 +144,32 @@ class APIDesignSkill(Skill):
                     "method": method,
                     "path": path,
                     "description": desc or f"{method} {path}",
-                    "status_codes": {str(k): str(v) for k, v in status_codes.items()},
+                    "status_codes": {sys.intern(str(k)): sys.intern(str(v)) for k, v in status_codes.items()},
                 }
             )
         return rows
 
     def _build_paths_from_endpoints(self, endpoints: list[dict[str, Any]]) -> dict[str, Any]:
+        """Build the OpenAPI ``paths`` view of rows from ``_normalise_endpoints``.
+
+        Rows are already validated and string-typed, so fields are used
+        as-is instead of being re-coerced per endpoint.
+        """
         paths: dict[str, Any] = {}
         for endpoint in endpoints:
-            method = str(endpoint.get("method", "GET")).lower()
-            path = str(endpoint.get("path", "/"))
-            description = str(endpoint.get("description", ""))
-            codes = endpoint.get("status_codes", {})
-            if not isinstance(codes, dict):
-                codes = {"200": "Success"}
-            responses = {str(code): {"description": str(text)} for code, text in codes.items()}
-            method_spec: dict[str, Any] = {
-                "summary": description,
-                "responses": responses,
-            }
-            if method in {"post", "put", "patch"}:
+            method = endpoint["method"].lower()
+            responses = {code: {"description": text} for code, text in endpoint["status_codes"].items()}
+            method_spec: dict[str, Any] = {"summary": endpoint["description"], "responses": responses}
+            if method in _BODY_METHODS:
                 method_spec["requestBody"] = {
                     "required": True,
                     "content": {"application/json": {"schema": {"type": "object"}}},
                 }
-            paths.setdefault(path, {})[method] = method_spec
+            paths.setdefault(endpoint["path"], {})[method] = method_spec
         return paths
 
     def _load_prompt_file(self, relative_path: str) -> str:
-        path = Path(__file__).resolve().parent / relative_path
-        try:
-            return path.read_text(encoding="utf-8").strip()
-        except OSError:
-            return ""
+        return load_prompt_file(__file__, relative_path)
 
     def _parse_json_response(self, text: str) -> dict[str, Any]:
         if not text:
@@ -170,7 +180,7 @@ class APIDesignSkill(Skill):
                 return parsed
         except json.JSONDecodeError:
             pass
-        block = re.search(r"```(?:json)?\s*(\{.*\})\s*```", text, flags=re.DOTALL)
+        block = _FENCED_JSON_RE.search(text)
         if block:
             try:
                 parsed = json.loads(block.group(1))
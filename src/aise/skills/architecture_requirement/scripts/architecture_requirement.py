@@ -4,11 +4,16 @@ from __future__ import annotations
 
 import json
 import re
-from pathlib import Path
+from collections import defaultdict
 from typing import Any
 
 from ....core.artifact import Artifact, ArtifactType
 from ....core.skill import Skill, SkillContext
+from ..._prompts import load_prompt_file
+
+# The numeric part of a well-formed SR id; "SR-SR-0001" does not match.
+_SR_ID_RE = re.compile(r"^SR-(\d+)$")
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(\{.*\})\s*```", re.DOTALL)
 
 
 class ArchitectureRequirementSkill(Skill):
@@ -35,8 +40,9 @@ class ArchitectureRequirementSkill(Skill):
         llm_ars = self._decompose_with_llm(requirements, context)
         ar_list = llm_ars
 
-        coverage = self._calculate_coverage(requirements, ar_list)
-        matrix = self._build_traceability_matrix(requirements, ar_list)
+        ar_ids_by_sr = self._group_ar_ids_by_sr(ar_list)
+        coverage = self._calculate_coverage(requirements, ar_ids_by_sr, len(ar_list))
+        matrix = self._build_traceability_matrix(requirements, ar_ids_by_sr)
 
         architecture_requirements_doc = {
             "project_name": project_name,
@@ -54,133 +60,33 @@ class ArchitectureRequirementSkill(Skill):
             metadata={"project_name": project_name, "analysis_mode": architecture_requirements_doc["analysis_mode"]},
         )
 
-    def _decompose_sr_to_ars(self, sr: dict[str, Any]) -> list[dict[str, Any]]:
-        """Decompose SR into 1 or more ARs based on architectural layers.
-
-        For functional requirements, create ARs for API, business, and optionally data layer.
-        For non-functional requirements, create a single AR for the most appropriate layer.
-        """
-        sr_id = sr["id"]
-        sr_num = sr_id.replace("SR-", "")  # Extract number: "SR-0001" -> "0001"
-        sr_desc = sr["description"]
-        sr_type = sr["type"]
-        sr_category = sr.get("category", "Unknown")
-
-        ars = []
-
-        if sr_type == "functional":
-            # Functional requirements typically span multiple layers
-            # Create AR for API layer
-            ars.append(
-                {
-                    "id": f"AR-SR-{sr_num}-1",
-                    "description": f"API层: {sr_desc[:80]}...",
-                    "source_sr": sr_id,
-                    "target_layer": "api",
-                    "component_type": "service",
-                    "estimated_complexity": self._estimate_complexity(sr),
-                }
-            )
-
-            # Create AR for business layer
-            ars.append(
-                {
-                    "id": f"AR-SR-{sr_num}-2",
-                    "description": f"业务层: {sr_desc[:80]}...",
-                    "source_sr": sr_id,
-                    "target_layer": "business",
-                    "component_type": "service",
-                    "estimated_complexity": self._estimate_complexity(sr),
-                }
-            )
-
-            # For data management features, add data layer AR
-            if any(keyword in sr_category.lower() for keyword in ["data", "storage", "persistence"]):
-                ars.append(
-                    {
-                        "id": f"AR-SR-{sr_num}-3",
-                        "description": f"数据层: {sr_desc[:80]}...",
-                        "source_sr": sr_id,
-                        "target_layer": "data",
-                        "component_type": "component",
-                        "estimated_complexity": self._estimate_complexity(sr),
-                    }
-                )
-
-        else:
-            # Non-functional requirements typically map to a single layer
-            target_layer = self._determine_nfr_layer(sr)
-            ars.append(
-                {
-                    "id": f"AR-SR-{sr_num}-1",
-                    "description": sr_desc,
-                    "source_sr": sr_id,
-                    "target_layer": target_layer,
-                    "component_type": "component",
-                    "estimated_complexity": self._estimate_complexity(sr),
-                }
-            )
-
-        return ars
-
-    def _determine_nfr_layer(self, sr: dict[str, Any]) -> str:
-        """Determine the most appropriate layer for a non-functional requirement."""
-        sr_category = sr.get("category", "").lower()
-        sr_desc = sr.get("description", "").lower()
-
-        # Performance/Scalability -> integration layer (caching, load balancing)
-        if any(keyword in sr_category or keyword in sr_desc for keyword in ["performance", "scalability", "caching"]):
-            return "integration"
-
-        # Security -> often cross-cutting, but prioritize API layer
-        security_keywords = ["security", "authentication", "authorization"]
-        if any(keyword in sr_category or keyword in sr_desc for keyword in security_keywords):
-            return "api"
-
-        # Data-related NFRs -> data layer
-        data_keywords = ["data", "database", "persistence", "consistency"]
-        if any(keyword in sr_category or keyword in sr_desc for keyword in data_keywords):
-            return "data"
-
-        # Default to business layer for other NFRs
-        return "business"
-
-    def _estimate_complexity(self, sr: dict[str, Any]) -> str:
-        """Estimate implementation complexity of an SR."""
-        priority = sr.get("priority", "medium")
-
-        # Simple heuristic: high priority often indicates complexity
-        if priority == "high":
-            return "high"
-        elif priority == "low":
-            return "low"
-        else:
-            return "medium"
-
-    def _calculate_coverage(self, requirements: list[dict], ar_list: list[dict]) -> dict[str, Any]:
-        """Calculate SR coverage by ARs."""
-        covered_srs = set()
+    def _group_ar_ids_by_sr(self, ar_list: list[dict]) -> dict[str, list[str]]:
+        """Group AR IDs by ``source_sr`` in one pass, for coverage and traceability."""
+        ar_ids_by_sr: dict[str, list[str]] = defaultdict(list)
         for ar in ar_list:
-            covered_srs.add(ar["source_sr"])
+            ar_ids_by_sr[ar["source_sr"]].append(ar["id"])
+        return ar_ids_by_sr
 
-        all_sr_ids = {sr["id"] for sr in requirements}
-        uncovered_srs = all_sr_ids - covered_srs
+    def _calculate_coverage(
+        self, requirements: list[dict], ar_ids_by_sr: dict[str, list[str]], total_ars: int
+    ) -> dict[str, Any]:
+        """Calculate SR coverage by ARs."""
+        covered_srs = ar_ids_by_sr.keys()
+        uncovered_srs = {sr["id"] for sr in requirements} - covered_srs
 
         return {
             "total_srs": len(requirements),
             "covered_srs": len(covered_srs),
-            "total_ars": len(ar_list),
+            "total_ars": total_ars,
             "uncovered_srs": list(uncovered_srs),
             "coverage_percentage": (len(covered_srs) / len(requirements) * 100) if requirements else 0,
         }
 
-    def _build_traceability_matrix(self, requirements: list[dict], ar_list: list[dict]) -> dict[str, list[str]]:
-        """Build traceability matrix mapping SR IDs to AR IDs."""
-        matrix = {}
-        for sr in requirements:
-            sr_id = sr["id"]
-            matrix[sr_id] = [ar["id"] for ar in ar_list if ar["source_sr"] == sr_id]
-        return matrix
+    def _build_traceability_matrix(
+        self, requirements: list[dict], ar_ids_by_sr: dict[str, list[str]]
+    ) -> dict[str, list[str]]:
+        """Build traceability matrix mapping SR IDs to AR IDs, in SR order."""
+        return {sr["id"]: ar_ids_by_sr.get(sr["id"], []) for sr in requirements}
 
     def _decompose_with_llm(
         self,
@@ -208,10 +114,12 @@ class ArchitectureRequirementSkill(Skill):
             "。顶层键必须是 architecture_requirements；所有键名与枚举值必须按示例精确输出；"
             "不得翻译或改名；不得包裹在 data/result/output/payload 下。"
         )
+        user_prompt = "SR列表:\n" + "\n".join(req_lines)
+
         response = context.llm_client.complete(
             [
                 {"role": "system", "content": system_prompt},
-                {"role": "user", "content": "SR列表:\n" + "\n".join(req_lines)},
+                {"role": "user", "content": user_prompt},
             ],
             response_format={"type": "json_object"},
         )
@@ -241,9 +149,12 @@ class ArchitectureRequirementSkill(Skill):
             source_sr = str(item.get("source_sr", "")).strip()
             if source_sr not in sr_ids:
                 continue
+            match = _SR_ID_RE.match(source_sr)
+            if match is None:
+                continue
+            sr_num = match.group(1)
             seq = counters.get(source_sr, 0) + 1
             counters[source_sr] = seq
-            sr_num = source_sr.replace("SR-", "")
             target_layer = str(item.get("target_layer", "business")).strip().lower()
             component_type = str(item.get("component_type", "component")).strip().lower()
             description = str(item.get("description", "")).strip()
@@ -269,11 +180,7 @@ class ArchitectureRequirementSkill(Skill):
         return rows
 
     def _load_prompt_file(self, relative_path: str) -> str:
-        path = Path(__file__).resolve().parent / relative_path
-        try:
-            return path.read_text(encoding="utf-8").strip()
-        except OSError:
-            return ""
+        return load_prompt_file(__file__, relative_path)
 
     def _parse_json_response(self, text: str) -> dict[str, Any]:
         if not text:
@@ -284,7 +191,7 @@ class ArchitectureRequirementSkill(Skill):
                 return parsed
         except json.JSONDecodeError:
             pass
-        block = re.search(r"```(?:json)?\s*(\{.*\})\s*```", text, flags=re.DOTALL)
+        block = _FENCED_JSON_RE.search(text)
         if block:
             try:
                 parsed = json.loads(block.group(1))
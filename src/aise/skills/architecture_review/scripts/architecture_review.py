@@ -20,16 +20,20 @@ class ArchitectureReviewSkill(Skill):
         return "Review artifacts against architectural design for consistency and violations"
 
     def execute(self, input_data: dict[str, Any], context: SkillContext) -> Artifact:
-        arch = context.artifact_store.get_latest(ArtifactType.ARCHITECTURE_DESIGN)
-        api = context.artifact_store.get_latest(ArtifactType.API_CONTRACT)
-        code = context.artifact_store.get_latest(ArtifactType.SOURCE_CODE)
+        latest = context.artifact_store.get_latest_many(
+            (ArtifactType.ARCHITECTURE_DESIGN, ArtifactType.API_CONTRACT, ArtifactType.SOURCE_CODE)
+        )
+        arch = latest[ArtifactType.ARCHITECTURE_DESIGN]
+        api = latest[ArtifactType.API_CONTRACT]
+        code = latest[ArtifactType.SOURCE_CODE]
 
         issues = []
         checks = []
 
         # Check architecture completeness
         if arch:
-            components = arch.content.get("components", [])
+            arch_content = arch.content
+            components = arch_content.get("components", [])
             checks.append(
                 {
                     "check": "component_coverage",
@@ -38,7 +42,7 @@ class ArchitectureReviewSkill(Skill):
                 }
             )
 
-            data_flows = arch.content.get("data_flows", [])
+            data_flows = arch_content.get("data_flows", [])
             checks.append(
                 {
                     "check": "data_flow_defined",
@@ -77,10 +81,12 @@ class ArchitectureReviewSkill(Skill):
         # Check code alignment if code exists
         if code and arch:
             code_modules = code.content.get("modules", [])
-            component_names = {c["name"] for c in arch.content.get("components", []) if c["type"] == "service"}
+            # One NUL-separated haystack lets each component check run as a
+            # single substring search instead of a Python loop over modules.
+            module_haystack = "\0".join((m.get("name") or "").lower() for m in code_modules)
+            component_names = {c["name"] for c in components if c["type"] == "service"}
             for comp_name in component_names:
-                found = any(comp_name.lower() in m.get("name", "").lower() for m in code_modules)
-                if not found:
+                if not code_modules or comp_name.lower() not in module_haystack:
                     issues.append(
                         {
                             "type": "missing_implementation",
@@ -93,7 +99,9 @@ class ArchitectureReviewSkill(Skill):
 
         if arch:
             new_status = ArtifactStatus.APPROVED if approved else ArtifactStatus.REJECTED
-            context.artifact_store.update_status(arch.id, new_status)
+            # Re-reviews that reach the same verdict leave the store untouched.
+            if arch.status != new_status:
+                context.artifact_store.update_status(arch.id, new_status)
 
         return Artifact(
             artifact_type=ArtifactType.REVIEW_FEEDBACK,
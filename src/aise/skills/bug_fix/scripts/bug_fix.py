@@ -34,13 +34,16 @@ class BugFixSkill(Skill):
         bug_reports = input_data.get("bug_reports", [])
         failing_tests = input_data.get("failing_tests", [])
         code = context.artifact_store.get_latest(ArtifactType.SOURCE_CODE)
+        # Names are gathered once for all bug reports instead of per bug.
+        module_names = [module["name"] for module in code.content.get("modules", [])] if code and bug_reports else []
 
         fixes = []
 
         for bug in bug_reports:
+            description = bug.get("description", "")
             fix = {
                 "bug_id": bug.get("id", "unknown"),
-                "description": bug.get("description", ""),
+                "description": description,
                 "root_cause": f"Analysis of: {bug.get('description', 'unknown issue')[:80]}",
                 "fix_description": f"Triage analysis for: {bug.get('description', 'unknown')[:60]}",
                 "files_changed": [],
@@ -48,12 +51,11 @@ class BugFixSkill(Skill):
             }
 
             # Identify affected module from bug description
-            if code:
-                for module in code.content.get("modules", []):
-                    module_name = module["name"]
-                    if module_name in bug.get("description", "").lower():
-                        fix["files_changed"].append(f"app/{module_name}/service.py")
-                        break
+            description_lower = description.lower()
+            for module_name in module_names:
+                if module_name in description_lower:
+                    fix["files_changed"].append(f"app/{module_name}/service.py")
+                    break
 
             if not fix["files_changed"]:
                 fix["files_changed"].append("app/unknown/service.py")
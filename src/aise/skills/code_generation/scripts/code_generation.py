@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from typing import Any
 
@@ -9,6 +10,12 @@ from ....core.artifact import Artifact, ArtifactType
 from ....core.skill import Skill, SkillContext
 
 
+@functools.lru_cache(maxsize=256)
+def _class_prefix(module_name: str) -> str:
+    """PascalCase class-name stem for a snake_case module name (``user_auth`` -> ``UserAuth``)."""
+    return module_name.title().replace("_", "")
+
+
 class CodeGenerationSkill(Skill):
     """Generate production-quality code from architecture design and API contracts."""
 
@@ -122,7 +129,7 @@ class CodeGenerationSkill(Skill):
             "from dataclasses import dataclass, field\n"
             "from datetime import datetime\n\n\n"
             f"@dataclass(slots=True)\n"
-            f"class {module_name.title().replace('_', '')}Model:\n"
+            f"class {_class_prefix(module_name)}Model:\n"
             f'    """Primary model for {module_name}."""\n\n'
             "    id: str = ''\n"
             "    created_at: datetime = field(default_factory=datetime.now)\n"
@@ -132,10 +139,11 @@ class CodeGenerationSkill(Skill):
 
     @staticmethod
     def _generate_routes(module_name: str, endpoints: list, language: str) -> str:
+        class_name = _class_prefix(module_name)
         route_lines = [
             f'"""Interface contracts for {module_name}."""\n',
-            f"from .service import {module_name.title().replace('_', '')}Service\n\n",
-            "service = " + f"{module_name.title().replace('_', '')}Service()\n\n",
+            f"from .service import {class_name}Service\n\n",
+            f"service = {class_name}Service()\n\n",
             "def list_contracts() -> list[dict[str, str]]:\n",
             "    return [",
         ]
@@ -182,7 +190,7 @@ class CodeGenerationSkill(Skill):
 
     @staticmethod
     def _generate_service(module_name: str, language: str) -> str:
-        class_name = module_name.title().replace("_", "")
+        class_name = _class_prefix(module_name)
         return (
             f'"""Business logic for {module_name}."""\n\n\n'
             f"class {class_name}Service:\n"
@@ -2,11 +2,37 @@
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from ....core.artifact import Artifact, ArtifactStatus, ArtifactType
 from ....core.skill import Skill, SkillContext
 
+# Every literal the heuristics look for, found in one pass per file. The
+# lookahead matches at every offset, so overlapping markers are all seen.
+_CODE_MARKERS = (
+    "eval(",
+    "exec(",
+    "execute(",
+    "%",
+    "format(",
+    'f"',
+    "os.system(",
+    "subprocess.call(",
+    "shell=True",
+    "pickle.loads(",
+    "yaml.load(",
+    "except:",
+    "pass",
+)
+_CODE_MARKER_RE = re.compile("(?=(" + "|".join(re.escape(m) for m in _CODE_MARKERS) + "))")
+_SECRET_KEYWORDS = ("api_key", "secret_key", "private_key", "token")
+# Matched against lowercased content; secret assignments are reported by keyword.
+_LOWER_MARKER_RE = re.compile(
+    "(?=(password|hardcoded|" + "|".join(rf"{k}(?= = [\"'])" for k in _SECRET_KEYWORDS) + "))"
+)
+_LONG_LINE_RE = re.compile(r"[^\n]{121,}")
+
 
 class CodeReviewSkill(Skill):
     """Review code for correctness, style, security, and performance."""
@@ -34,9 +60,10 @@ class CodeReviewSkill(Skill):
                     content = file_info.get("content", "")
 
                     # Security checks (heuristic — not a substitute for a full security audit)
-                    content_lower = content.lower()
+                    hits = set(_CODE_MARKER_RE.findall(content))
+                    lower_hits = set(_LOWER_MARKER_RE.findall(content.lower()))
 
-                    if "eval(" in content or "exec(" in content:
+                    if "eval(" in hits or "exec(" in hits:
                         categories["security"].append(
                             {
                                 "file": file_info["path"],
@@ -45,7 +72,7 @@ class CodeReviewSkill(Skill):
                             }
                         )
 
-                    if "password" in content_lower and "hardcoded" not in content_lower:
+                    if "password" in lower_hits and "hardcoded" not in lower_hits:
                         categories["security"].append(
                             {
                                 "file": file_info["path"],
@@ -55,7 +82,7 @@ class CodeReviewSkill(Skill):
                         )
 
                     # SQL injection indicators
-                    if "execute(" in content and ("%" in content or "format(" in content or 'f"' in content):
+                    if "execute(" in hits and ("%" in hits or "format(" in hits or 'f"' in hits):
                         categories["security"].append(
                             {
                                 "file": file_info["path"],
@@ -65,7 +92,7 @@ class CodeReviewSkill(Skill):
                         )
 
                     # Command injection
-                    if "os.system(" in content or ("subprocess.call(" in content and "shell=True" in content):
+                    if "os.system(" in hits or ("subprocess.call(" in hits and "shell=True" in hits):
                         categories["security"].append(
                             {
                                 "file": file_info["path"],
@@ -75,7 +102,7 @@ class CodeReviewSkill(Skill):
                         )
 
                     # Unsafe deserialization
-                    if "pickle.loads(" in content or "yaml.load(" in content:
+                    if "pickle.loads(" in hits or "yaml.load(" in hits:
                         categories["security"].append(
                             {
                                 "file": file_info["path"],
@@ -85,8 +112,8 @@ class CodeReviewSkill(Skill):
                         )
 
                     # Hardcoded secrets patterns
-                    for keyword in ("api_key", "secret_key", "private_key", "token"):
-                        if f'{keyword} = "' in content_lower or f"{keyword} = '" in content_lower:
+                    for keyword in _SECRET_KEYWORDS:
+                        if keyword in lower_hits:
                             categories["security"].append(
                                 {
                                     "file": file_info["path"],
@@ -95,21 +122,22 @@ class CodeReviewSkill(Skill):
                                 }
                             )
 
-                    # Style checks
-                    lines = content.split("\n")
-                    for i, line in enumerate(lines, 1):
-                        if len(line) > 120:
-                            categories["style"].append(
-                                {
-                                    "file": file_info["path"],
-                                    "line": i,
-                                    "issue": "Line exceeds 120 characters",
-                                    "severity": "low",
-                                }
-                            )
+                    # Style checks: jump between long lines, counting newlines for the line number
+                    line_no, counted_to = 1, 0
+                    for match in _LONG_LINE_RE.finditer(content):
+                        line_no += content.count("\n", counted_to, match.start())
+                        counted_to = match.start()
+                        categories["style"].append(
+                            {
+                                "file": file_info["path"],
+                                "line": line_no,
+                                "issue": "Line exceeds 120 characters",
+                                "severity": "low",
+                            }
+                        )
 
                     # Correctness: check for empty except blocks
-                    if "except:" in content and "pass" in content:
+                    if "except:" in hits and "pass" in hits:
                         categories["correctness"].append(
                             {
                                 "file": file_info["path"],
@@ -7,6 +7,13 @@ from typing import Any
 from ....core.artifact import Artifact, ArtifactType
 from ....core.skill import Skill, SkillContext
 
+# (NFR keyword, option keywords, rationale), checked in order; the first NFR
+# keyword found in the requirements decides which options are preferred.
+_NFR_PREFERENCES = (
+    ("performance", ("performance", "fast"), "Selected for performance alignment with NFRs"),
+    ("security", ("security", "secure"), "Selected for security alignment with NFRs"),
+)
+
 
 class ConflictResolutionSkill(Skill):
     """Mediate disagreements between agents on design or implementation decisions."""
@@ -28,34 +35,32 @@ class ConflictResolutionSkill(Skill):
         conflicts = input_data["conflicts"]
         resolutions = []
 
+        # Decision logic: prefer options aligned with requirements. The NFRs
+        # are the same for every conflict, so read them once.
+        reqs = context.artifact_store.get_latest(ArtifactType.REQUIREMENTS)
+        nfr_text = ""
+        if reqs:
+            nfr_text = " ".join(
+                r.get("description", "").lower() for r in reqs.content.get("non_functional_requirements", [])
+            )
+        preference = next((p for p in _NFR_PREFERENCES if p[0] in nfr_text), None)
+
         for conflict in conflicts:
             parties = conflict.get("parties", [])
             issue = conflict.get("issue", "")
             options = conflict.get("options", [])
 
-            # Decision logic: prefer options aligned with requirements
-            reqs = context.artifact_store.get_latest(ArtifactType.REQUIREMENTS)
-            nfr_text = ""
-            if reqs:
-                nfr_text = " ".join(
-                    r.get("description", "").lower() for r in reqs.content.get("non_functional_requirements", [])
-                )
-
             chosen_option = options[0] if options else "defer to architect"
             rationale = "Default selection - first proposed option"
 
-            # Simple heuristic: prefer performance-oriented options if NFRs mention performance
-            if "performance" in nfr_text:
-                for opt in options:
-                    if "performance" in str(opt).lower() or "fast" in str(opt).lower():
-                        chosen_option = opt
-                        rationale = "Selected for performance alignment with NFRs"
-                        break
-            elif "security" in nfr_text:
+            # Simple heuristic: prefer options matching the NFRs' first concern
+            if preference is not None:
+                _, option_keywords, preferred_rationale = preference
                 for opt in options:
-                    if "security" in str(opt).lower() or "secure" in str(opt).lower():
+                    opt_lower = str(opt).lower()
+                    if any(keyword in opt_lower for keyword in option_keywords):
                         chosen_option = opt
-                        rationale = "Selected for security alignment with NFRs"
+                        rationale = preferred_rationale
                         break
 
             resolutions.append(
@@ -367,7 +367,6 @@ class DeepArchitectureWorkflowSkill(Skill):
                 "step": "step1",
             },
         )
-        context.artifact_store.store(architecture_artifact)
 
         api_artifact = Artifact(
             artifact_type=ArtifactType.API_CONTRACT,
@@ -375,7 +374,6 @@ class DeepArchitectureWorkflowSkill(Skill):
             producer="architecture_designer",
             metadata={"project_name": project_name, "step": "step2"},
         )
-        context.artifact_store.store(api_artifact)
 
         tech_stack_artifact = Artifact(
             artifact_type=ArtifactType.TECH_STACK,
@@ -383,7 +381,6 @@ class DeepArchitectureWorkflowSkill(Skill):
             producer="architecture_designer",
             metadata={"project_name": project_name, "step": "step2"},
         )
-        context.artifact_store.store(tech_stack_artifact)
 
         architecture_requirement_artifact = Artifact(
             artifact_type=ArtifactType.ARCHITECTURE_REQUIREMENT,
@@ -391,7 +388,6 @@ class DeepArchitectureWorkflowSkill(Skill):
             producer="architecture_designer",
             metadata={"project_name": project_name, "step": "step4"},
         )
-        context.artifact_store.store(architecture_requirement_artifact)
 
         functional_design_artifact = Artifact(
             artifact_type=ArtifactType.FUNCTIONAL_DESIGN,
@@ -399,7 +395,6 @@ class DeepArchitectureWorkflowSkill(Skill):
             producer="subsystem_architect",
             metadata={"project_name": project_name, "step": "step4"},
         )
-        context.artifact_store.store(functional_design_artifact)
 
         status_tracking_artifact = Artifact(
             artifact_type=ArtifactType.STATUS_TRACKING,
@@ -414,7 +409,6 @@ class DeepArchitectureWorkflowSkill(Skill):
             producer="architect",
             metadata={"project_name": project_name, "step": "status"},
         )
-        context.artifact_store.store(status_tracking_artifact)
 
         review_artifact = Artifact(
             artifact_type=ArtifactType.REVIEW_FEEDBACK,
@@ -429,7 +423,17 @@ class DeepArchitectureWorkflowSkill(Skill):
             producer="architecture_reviewer",
             metadata={"project_name": project_name},
         )
-        context.artifact_store.store(review_artifact)
+        context.artifact_store.store_many(
+            (
+                architecture_artifact,
+                api_artifact,
+                tech_stack_artifact,
+                architecture_requirement_artifact,
+                functional_design_artifact,
+                status_tracking_artifact,
+                review_artifact,
+            )
+        )
 
         generated_docs = [str(architecture_doc_path), *[str(path) for path in detail_doc_paths]]
         generated_sources = [*bootstrap_files, *subsystem_scaffold_files]
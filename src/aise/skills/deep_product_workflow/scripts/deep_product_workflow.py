@@ -224,7 +224,6 @@ class DeepProductWorkflowSkill(Skill):
             producer="product_designer",
             metadata={"project_name": project_name, "subagent": "product_designer", "step": "requirement_expansion"},
         )
-        context.artifact_store.store(requirements_artifact)
 
         system_design_artifact = Artifact(
             artifact_type=ArtifactType.SYSTEM_DESIGN,
@@ -232,7 +231,6 @@ class DeepProductWorkflowSkill(Skill):
             producer="product_designer",
             metadata={"project_name": project_name, "subagent": "product_designer", "step": "product_design"},
         )
-        context.artifact_store.store(system_design_artifact)
 
         system_requirements_artifact = Artifact(
             artifact_type=ArtifactType.SYSTEM_REQUIREMENTS,
@@ -244,7 +242,6 @@ class DeepProductWorkflowSkill(Skill):
                 "step": "system_requirement_design",
             },
         )
-        context.artifact_store.store(system_requirements_artifact)
 
         latest_review = requirements_rounds[-1].get("review", {}) if requirements_rounds else {}
         review_artifact = Artifact(
@@ -259,7 +256,14 @@ class DeepProductWorkflowSkill(Skill):
             producer="product_reviewer",
             metadata={"project_name": project_name, "subagent": "product_reviewer", "step": "review"},
         )
-        context.artifact_store.store(review_artifact)
+        context.artifact_store.store_many(
+            (
+                requirements_artifact,
+                system_design_artifact,
+                system_requirements_artifact,
+                review_artifact,
+            )
+        )
 
         return Artifact(
             artifact_type=ArtifactType.PROGRESS_REPORT,
@@ -2,13 +2,92 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import re
-from pathlib import Path
+import sys
+from collections import defaultdict
 from typing import Any
 
 from ....core.artifact import Artifact, ArtifactType
 from ....core.skill import Skill, SkillContext
+from ..._prompts import load_prompt_file
+
+# Zero-width split points before each inner capital: "UserService" -> "User_Service".
+_CAMEL_SPLIT_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+# Subsystem keywords in priority order: the first subsystem with any keyword
+# in the description wins, wherever in the text the keyword appears.
+_SUBSYSTEM_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("auth_service", ("auth", "login", "登录", "认证")),
+    ("user_management", ("user", "用户")),
+    ("product_service", ("product", "产品")),
+    ("order_management", ("order", "订单")),
+    ("payment_service", ("payment", "支付")),
+    ("repositories", ("database", "数据库", "repository")),
+    ("cache_service", ("cache", "缓存")),
+)
+_SUBSYSTEM_PRIORITY = {name: rank for rank, (name, _) in enumerate(_SUBSYSTEM_KEYWORDS)}
+# One named group per subsystem inside a lookahead, so a single scan reports
+# every keyword occurrence (overlapping ones included) without consuming text.
+_SUBSYSTEM_RE = re.compile(
+    "(?="
+    + "|".join(f"(?P<{name}>{'|'.join(map(re.escape, keywords))})" for name, keywords in _SUBSYSTEM_KEYWORDS)
+    + ")"
+)
+# Layer prefixes that architecture_requirement puts on AR descriptions.
+_LAYER_PREFIX_RE = re.compile("API层:|业务层:|数据层:|集成层:")
+# Exactly the characters for which str.isalnum() is false (\w also admits "_").
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+_LAYER_DEFAULT_SUBSYSTEMS = {
+    "api": "api_core",
+    "business": "business_core",
+    "data": "data_core",
+    "integration": "external_services",
+}
+
+
+# Both helpers are pure functions of their string arguments and run once per
+# FN row, so repeated descriptions (re-runs, shared boilerplate) hit the cache.
+@functools.lru_cache(maxsize=4096)
+def _function_name(description: str, component_type: str) -> str:
+    """PascalCase FN name from the first words of an AR description."""
+    # Extract key words from description
+    # Remove layer prefixes like "API层:", "业务层:", etc. in one pass
+    clean_desc = _LAYER_PREFIX_RE.sub("", description)
+
+    # Take first few words
+    words = clean_desc.split()[:3]
+
+    # Convert to PascalCase
+    pascal_words = []
+    for word in words:
+        # Remove special characters
+        clean_word = _NON_ALNUM_RE.sub("", word)
+        if clean_word:
+            pascal_words.append(clean_word.capitalize())
+
+    name = "".join(pascal_words)
+
+    # Add suffix for services
+    if component_type == "service":
+        if not name.endswith("Service"):
+            name += "Service"
+
+    # Ensure valid name
+    if not name or not name[0].isalpha():
+        name = "GenericService" if component_type == "service" else "GenericComponent"
+
+    return name
+
+
+@functools.lru_cache(maxsize=4096)
+def _subsystem_for(desc_lower: str, layer: str) -> str:
+    """Highest-priority keyword subsystem in ``desc_lower``, else the layer default."""
+    found = {match.lastgroup for match in _SUBSYSTEM_RE.finditer(desc_lower)}
+    if found:
+        return min(found, key=_SUBSYSTEM_PRIORITY.__getitem__)
+    return _LAYER_DEFAULT_SUBSYSTEMS.get(layer, "common")
 
 
 class FunctionalDesignSkill(Skill):
@@ -37,11 +116,10 @@ class FunctionalDesignSkill(Skill):
         llm_functions = self._generate_with_llm(ars, context)
         all_functions = llm_functions
 
-        architecture_layers = self._build_layer_structure(all_functions)
-        traceability_matrix = self._build_fn_ar_matrix(all_functions)
+        architecture_layers, traceability_matrix, type_counts = self._index_functions(all_functions)
 
-        num_components = len([fn for fn in all_functions if fn.get("type") == "component"])
-        num_services = len([fn for fn in all_functions if fn.get("type") == "service"])
+        num_components = type_counts["component"]
+        num_services = type_counts["service"]
         functional_design_doc = {
             "project_name": project_name,
             "overview": f"Functional design with {num_components} components and {num_services} services",
@@ -58,219 +136,50 @@ class FunctionalDesignSkill(Skill):
             metadata={"project_name": project_name, "analysis_mode": functional_design_doc["analysis_mode"]},
         )
 
-    def _group_by_layer(self, ars: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
-        """Group ARs by target layer."""
-        layers = {"api": [], "business": [], "data": [], "integration": []}
-
-        for ar in ars:
-            target_layer = ar.get("target_layer", "business")
-            if target_layer in layers:
-                layers[target_layer].append(ar)
-            else:
-                layers["business"].append(ar)  # Default to business
-
-        return layers
-
-    def _create_function_from_ar(
-        self, ar: dict[str, Any], service_counter: int, component_counter: int, project_name: str
-    ) -> dict[str, Any]:
-        """Create a function definition from an AR."""
-        ar_id = ar["id"]
-        ar_desc = ar["description"]
-        target_layer = ar["target_layer"]
-        component_type = ar["component_type"]
-
-        # Generate FN ID
-        if component_type == "service":
-            fn_id = f"FN-SERVICE-{service_counter:03d}"
-        else:
-            fn_id = f"FN-COM-{component_counter:03d}"
-
-        # Generate function name from description
-        fn_name = self._generate_function_name(ar_desc, component_type)
-
-        # Determine subsystem (service domain) based on AR description
-        subsystem = self._determine_subsystem(ar_desc, target_layer)
-
-        # Generate file path
-        file_path = self._generate_file_path(target_layer, subsystem, fn_name)
-
-        # Generate interfaces for services
-        interfaces = []
-        if component_type == "service":
-            interfaces = self._generate_interfaces_for_service(ar, fn_name)
-
-        fn = {
-            "id": fn_id,
-            "type": component_type,
-            "name": fn_name,
-            "description": ar_desc,
-            "layer": target_layer,
-            "subsystem": subsystem,
-            "source_ars": [ar_id],
-            "interfaces": interfaces,
-            "dependencies": [],  # Can be enhanced later
-            "file_path": file_path,
-            "estimated_complexity": ar.get("estimated_complexity", "medium"),
-        }
-
-        return fn
-
     def _generate_function_name(self, description: str, component_type: str) -> str:
         """Generate PascalCase function name from description."""
-        # Extract key words from description
-        # Remove common prefixes like "API层:", "业务层:", etc.
-        clean_desc = description
-        for prefix in ["API层:", "业务层:", "数据层:", "集成层:"]:
-            clean_desc = clean_desc.replace(prefix, "").strip()
-
-        # Take first few words
-        words = clean_desc.split()[:3]
-
-        # Convert to PascalCase
-        pascal_words = []
-        for word in words:
-            # Remove special characters
-            clean_word = "".join(c for c in word if c.isalnum() or c.isspace())
-            if clean_word:
-                pascal_words.append(clean_word.capitalize())
-
-        name = "".join(pascal_words)
-
-        # Add suffix for services
-        if component_type == "service":
-            if not name.endswith("Service"):
-                name += "Service"
-
-        # Ensure valid name
-        if not name or not name[0].isalpha():
-            name = "GenericService" if component_type == "service" else "GenericComponent"
-
-        return name
-
-    def _determine_subsystem(self, description: str, layer: str) -> str:
-        """Determine subsystem (service domain) from AR description."""
-        desc_lower = description.lower()
-
-        # Common subsystem keywords
-        if any(keyword in desc_lower for keyword in ["auth", "login", "登录", "认证"]):
-            return "auth_service"
-        elif any(keyword in desc_lower for keyword in ["user", "用户"]):
-            return "user_management"
-        elif any(keyword in desc_lower for keyword in ["product", "产品"]):
-            return "product_service"
-        elif any(keyword in desc_lower for keyword in ["order", "订单"]):
-            return "order_management"
-        elif any(keyword in desc_lower for keyword in ["payment", "支付"]):
-            return "payment_service"
-        elif any(keyword in desc_lower for keyword in ["database", "数据库", "repository"]):
-            return "repositories"
-        elif any(keyword in desc_lower for keyword in ["cache", "缓存"]):
-            return "cache_service"
-
-        # Default subsystems by layer
-        layer_defaults = {
-            "api": "api_core",
-            "business": "business_core",
-            "data": "data_core",
-            "integration": "external_services",
-        }
+        return _function_name(description, component_type)
 
-        return layer_defaults.get(layer, "common")
+    def _determine_subsystem(self, desc_lower: str, layer: str) -> str:
+        """Determine subsystem (service domain) from a lowercased AR description."""
+        return _subsystem_for(desc_lower, layer)
 
     def _generate_file_path(self, layer: str, subsystem: str, function_name: str) -> str:
         """Generate file path following layer/subsystem/component structure."""
         # Convert PascalCase to snake_case for file name
-        import re
-
-        snake_case_name = re.sub(r"(?<!^)(?=[A-Z])", "_", function_name).lower()
+        snake_case_name = _CAMEL_SPLIT_RE.sub("_", function_name).lower()
 
         return f"src/{layer}_layer/{subsystem}/{snake_case_name}.py"
 
-    def _generate_interfaces_for_service(self, ar: dict[str, Any], service_name: str) -> list[dict[str, Any]]:
-        """Generate API interface definitions for a service."""
-        interfaces = []
-
-        # Determine HTTP method and path based on AR description
-        desc_lower = ar["description"].lower()
-
-        # Extract resource name from service name (remove "Service" suffix)
-        resource = service_name.replace("Service", "").lower()
-
-        # Generate basic CRUD interfaces for services
-        if ar.get("target_layer") == "api":
-            # Create
-            if any(keyword in desc_lower for keyword in ["create", "add", "新增", "创建"]):
-                interfaces.append(
-                    {"method": "POST", "path": f"/api/v1/{resource}", "description": f"Create {resource}"}
-                )
-
-            # Read
-            if any(keyword in desc_lower for keyword in ["get", "read", "list", "查询", "获取"]):
-                interfaces.append({"method": "GET", "path": f"/api/v1/{resource}", "description": f"List {resource}"})
-                interfaces.append(
-                    {"method": "GET", "path": f"/api/v1/{resource}/{{id}}", "description": f"Get {resource} by ID"}
-                )
-
-            # Update
-            if any(keyword in desc_lower for keyword in ["update", "modify", "更新", "修改"]):
-                interfaces.append(
-                    {"method": "PUT", "path": f"/api/v1/{resource}/{{id}}", "description": f"Update {resource}"}
-                )
-
-            # Delete
-            if any(keyword in desc_lower for keyword in ["delete", "remove", "删除"]):
-                interfaces.append(
-                    {"method": "DELETE", "path": f"/api/v1/{resource}/{{id}}", "description": f"Delete {resource}"}
-                )
-
-            # If no specific operation detected, add basic GET
-            if not interfaces:
-                interfaces.append(
-                    {
-                        "method": "POST",
-                        "path": f"/api/v1/{resource}/execute",
-                        "description": f"Execute {resource} operation",
-                    }
-                )
-
-        return interfaces
-
-    def _build_layer_structure(self, functions: list[dict[str, Any]]) -> dict[str, Any]:
-        """Build hierarchical layer structure."""
+    def _index_functions(
+        self, functions: list[dict[str, Any]]
+    ) -> tuple[dict[str, Any], dict[str, list[str]], dict[str, int]]:
+        """Build the layer structure, AR→FN traceability matrix and FN type counts in one pass."""
         layers = {
             "api_layer": {"services": [], "components": []},
             "business_layer": {"services": [], "components": []},
             "data_layer": {"services": [], "components": []},
             "integration_layer": {"services": [], "components": []},
         }
+        matrix: dict[str, list[str]] = defaultdict(list)
+        type_counts: dict[str, int] = defaultdict(int)
 
         for fn in functions:
-            layer = str(fn.get("layer", "business")).strip().lower()
-            layer_key = f"{layer}_layer"
-            if layer_key in layers:
-                fn_type = str(fn.get("type", "component")).strip().lower()
-                fn_id = str(fn.get("id", "")).strip()
-                if not fn_id:
-                    continue
-                if fn_type == "service":
-                    layers[layer_key].setdefault("services", []).append(fn_id)
-                else:
-                    layers[layer_key].setdefault("components", []).append(fn_id)
-
-        return layers
-
-    def _build_fn_ar_matrix(self, functions: list[dict[str, Any]]) -> dict[str, list[str]]:
-        """Build traceability matrix mapping AR IDs to FN IDs."""
-        matrix = {}
-
-        for fn in functions:
+            type_counts[fn.get("type")] += 1
             for ar_id in fn["source_ars"]:
-                if ar_id not in matrix:
-                    matrix[ar_id] = []
                 matrix[ar_id].append(fn["id"])
 
-        return matrix
+            layer = str(fn.get("layer", "business")).strip().lower()
+            layer_entry = layers.get(f"{layer}_layer")
+            if layer_entry is None:
+                continue
+            fn_id = str(fn.get("id", "")).strip()
+            if not fn_id:
+                continue
+            fn_type = str(fn.get("type", "component")).strip().lower()
+            layer_entry["services" if fn_type == "service" else "components"].append(fn_id)
+
+        return layers, dict(matrix), type_counts
 
     def _generate_with_llm(self, ars: list[dict[str, Any]], context: SkillContext) -> list[dict[str, Any]]:
         if context.llm_client is None:
@@ -317,6 +226,7 @@ class FunctionalDesignSkill(Skill):
         rows: list[Any],
         ars: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
+        """Validate LLM FN rows; enum-like fields are interned since they repeat on every row."""
         layer_set = {"api", "business", "data", "integration"}
         ar_ids = {str(ar.get("id", "")) for ar in ars}
         service_index = 0
@@ -329,7 +239,7 @@ class FunctionalDesignSkill(Skill):
             source_ar = str(item.get("source_ar", "")).strip()
             if source_ar not in ar_ids:
                 continue
-            fn_type = str(item.get("type", "component")).strip().lower()
+            fn_type = sys.intern(str(item.get("type", "component")).strip().lower())
             if fn_type not in {"service", "component"}:
                 fn_type = "component"
             if fn_type == "service":
@@ -339,7 +249,7 @@ class FunctionalDesignSkill(Skill):
                 component_index += 1
                 fn_id = f"FN-COM-{component_index:03d}"
 
-            layer = str(item.get("layer", "business")).strip().lower()
+            layer = sys.intern(str(item.get("layer", "business")).strip().lower())
             if layer not in layer_set:
                 layer = "business"
             name = str(item.get("name", "")).strip() or self._generate_function_name(
@@ -347,7 +257,8 @@ class FunctionalDesignSkill(Skill):
                 fn_type,
             )
             desc = str(item.get("description", "")).strip() or f"Implements {source_ar}"
-            subsystem = str(item.get("subsystem", "")).strip() or self._determine_subsystem(desc, layer)
+            subsystem = str(item.get("subsystem", "")).strip() or self._determine_subsystem(desc.lower(), layer)
+            subsystem = sys.intern(subsystem)
             file_path = str(item.get("file_path", "")).strip() or self._generate_file_path(layer, subsystem, name)
             interfaces = item.get("interfaces", [])
             if not isinstance(interfaces, list):
@@ -355,7 +266,7 @@ class FunctionalDesignSkill(Skill):
             dependencies = item.get("dependencies", [])
             if not isinstance(dependencies, list):
                 dependencies = []
-            complexity = str(item.get("estimated_complexity", "medium")).strip().lower()
+            complexity = sys.intern(str(item.get("estimated_complexity", "medium")).strip().lower())
             if complexity not in {"low", "medium", "high"}:
                 complexity = "medium"
 
@@ -377,11 +288,7 @@ class FunctionalDesignSkill(Skill):
         return output
 
     def _load_prompt_file(self, relative_path: str) -> str:
-        path = Path(__file__).resolve().parent / relative_path
-        try:
-            return path.read_text(encoding="utf-8").strip()
-        except OSError:
-            return ""
+        return load_prompt_file(__file__, relative_path)
 
     def _parse_json_response(self, text: str) -> dict[str, Any]:
         if not text:
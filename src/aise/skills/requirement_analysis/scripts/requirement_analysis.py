@@ -9,6 +9,7 @@ from typing import Any
 
 from ....core.artifact import Artifact, ArtifactType
 from ....core.skill import Skill, SkillContext
+from ..._prompts import load_prompt_file
 
 
 class RequirementAnalysisSkill(Skill):
@@ -108,11 +109,7 @@ class RequirementAnalysisSkill(Skill):
         return data
 
     def _load_prompt_file(self, relative_path: str) -> str:
-        path = Path(__file__).resolve().parent / relative_path
-        try:
-            return path.read_text(encoding="utf-8").strip()
-        except OSError:
-            return ""
+        return load_prompt_file(__file__, relative_path)
 
     def _parse_json_response(self, text: str) -> dict[str, Any] | None:
         try:
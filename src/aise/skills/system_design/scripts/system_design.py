@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import json
 import re
-from pathlib import Path
 from typing import Any
 
 from ....core.artifact import Artifact, ArtifactType
 from ....core.skill import Skill, SkillContext
+from ..._prompts import load_prompt_file
 
 
 class SystemDesignSkill(Skill):
@@ -204,11 +204,7 @@ class SystemDesignSkill(Skill):
         return rows
 
     def _load_prompt_file(self, relative_path: str) -> str:
-        path = Path(__file__).resolve().parent / relative_path
-        try:
-            return path.read_text(encoding="utf-8").strip()
-        except OSError:
-            return ""
+        return load_prompt_file(__file__, relative_path)
 
     def _parse_json_response(self, text: str) -> dict[str, Any]:
         if not text:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 from ....core.artifact import Artifact, ArtifactType
@@ -154,9 +155,13 @@ class SystemRequirementAnalysisSkill(Skill):
     def _build_traceability_matrix(
         self, requirements: list[dict[str, Any]], features: list[dict[str, Any]]
     ) -> dict[str, list[str]]:
-        """Build a traceability matrix mapping SFs to SRs."""
-        matrix = {}
-        for sf in features:
-            sf_id = sf["id"]
-            matrix[sf_id] = [req["id"] for req in requirements if sf_id in req["source_sfs"]]
-        return matrix
+        """Build a traceability matrix mapping SFs to SRs.
+
+        Requirements are grouped by source SF in one pass, then emitted in
+        SF order, instead of rescanning every requirement for each SF.
+        """
+        req_ids_by_sf: dict[str, list[str]] = defaultdict(list)
+        for req in requirements:
+            for sf_id in dict.fromkeys(req["source_sfs"]):
+                req_ids_by_sf[sf_id].append(req["id"])
+        return {sf["id"]: req_ids_by_sf.get(sf["id"], []) for sf in features}
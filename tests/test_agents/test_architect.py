@@ -51,7 +51,8 @@ class TestArchitectAgent:
         arch.execute_skill("system_design", {})
         artifact = arch.execute_skill("api_design", {})
         assert "endpoints" in artifact.content
-        assert "schemas" in artifact.content
+        assert "schemas" in artifact.content["components"]
+        assert "schemas" not in artifact.content
 
     def test_tech_stack_selection(self):
         arch, store = self._setup_with_requirements()
@@ -68,6 +69,62 @@ class TestArchitectAgent:
         assert "approved" in artifact.content
         assert "checks" in artifact.content
 
+    def test_architecture_review_flags_components_without_code(self):
+        from aise.core.artifact import Artifact, ArtifactType
+
+        bus = MessageBus()
+        store = ArtifactStore()
+        arch = ArchitectAgent(bus, store)
+        components = [
+            {"name": "OrderService", "type": "service"},
+            {"name": "BillingService", "type": "service"},
+            {"name": "Postgres", "type": "infrastructure"},
+        ]
+        store.store(Artifact(ArtifactType.ARCHITECTURE_DESIGN, {"components": components}, producer="architect"))
+        store.store(Artifact(ArtifactType.SOURCE_CODE, {"modules": [{"name": "app.orderservice"}]}, producer="dev"))
+
+        artifact = arch.execute_skill("architecture_review", {})
+        missing = [i["description"] for i in artifact.content["issues"] if i["type"] == "missing_implementation"]
+        assert missing == ["Component 'BillingService' has no corresponding code module"]
+
+    def test_architecture_review_matches_components_across_modules(self):
+        from aise.core.artifact import Artifact, ArtifactType
+
+        bus = MessageBus()
+        store = ArtifactStore()
+        arch = ArchitectAgent(bus, store)
+        components = [{"name": "OrderService", "type": "service"}, {"name": "ServiceOrder", "type": "service"}]
+        modules = [{"name": None}, {}, {"name": "app.Order"}, {"name": "Service.api"}]
+        store.store(Artifact(ArtifactType.ARCHITECTURE_DESIGN, {"components": components}, producer="architect"))
+        store.store(Artifact(ArtifactType.SOURCE_CODE, {"modules": modules}, producer="dev"))
+
+        artifact = arch.execute_skill("architecture_review", {})
+        missing = sorted(i["description"] for i in artifact.content["issues"] if i["type"] == "missing_implementation")
+        # Names spanning two module boundaries must not count as implemented.
+        assert missing == [
+            "Component 'OrderService' has no corresponding code module",
+            "Component 'ServiceOrder' has no corresponding code module",
+        ]
+
+    def test_architecture_review_skips_unchanged_status_writes(self, monkeypatch):
+        from aise.core.artifact import Artifact, ArtifactStatus, ArtifactType
+
+        bus = MessageBus()
+        store = ArtifactStore()
+        arch = ArchitectAgent(bus, store)
+        design = Artifact(ArtifactType.ARCHITECTURE_DESIGN, {"components": [], "data_flows": []}, producer="architect")
+        store.store(design)
+        store.store(Artifact(ArtifactType.API_CONTRACT, {"endpoints": []}, producer="architect"))
+
+        writes = []
+        original = store.update_status
+        monkeypatch.setattr(store, "update_status", lambda aid, status: (writes.append(status), original(aid, status)))
+
+        arch.execute_skill("architecture_review", {})
+        arch.execute_skill("architecture_review", {})
+        assert design.status == ArtifactStatus.APPROVED
+        assert writes == [ArtifactStatus.APPROVED]
+
     def test_run_full_architecture_workflow_generates_system_architecture_doc(self, tmp_path):
         bus = MessageBus()
         store = ArtifactStore()
@@ -49,6 +49,37 @@ class TestDeveloperAgent:
         assert "approved" in artifact.content
         assert "findings" in artifact.content
 
+    def test_code_review_flags_heuristic_findings(self):
+        from aise.core.artifact import Artifact, ArtifactType
+
+        bus = MessageBus()
+        store = ArtifactStore()
+        dev = DeveloperAgent(bus, store)
+        content = "\n".join(
+            [
+                'cursor.execute(f"SELECT {name}")',
+                "API_KEY = 'abc'",
+                "x" * 121,
+                "try:",
+                "    run()",
+                "except:",
+                "    pass",
+                "y" * 200,
+            ]
+        )
+        module = {"name": "app", "files": [{"path": "app/main.py", "content": content}]}
+        store.store(Artifact(ArtifactType.SOURCE_CODE, {"modules": [module]}, producer="developer"))
+
+        artifact = dev.execute_skill("code_review", {})
+        issues = [(f["category"], f.get("line"), f["issue"]) for f in artifact.content["findings"]]
+        assert issues == [
+            ("correctness", None, "Bare except with pass - errors may be silently swallowed"),
+            ("style", 3, "Line exceeds 120 characters"),
+            ("style", 8, "Line exceeds 120 characters"),
+            ("security", None, "Potential SQL injection - string formatting in query execution"),
+            ("security", None, "Potential hardcoded secret (api_key)"),
+        ]
+
     def test_bug_fix(self):
         dev, store = self._setup_with_design()
         artifact = dev.execute_skill(
@@ -58,3 +89,32 @@ class TestDeveloperAgent:
             },
         )
         assert artifact.content["total_bugs"] == 1
+
+    def test_bug_fix_maps_bugs_to_modules(self):
+        from aise.core.artifact import Artifact, ArtifactType
+
+        bus = MessageBus()
+        store = ArtifactStore()
+        dev = DeveloperAgent(bus, store)
+        modules = [{"name": "auth"}, {"name": "billing"}]
+        store.store(Artifact(ArtifactType.SOURCE_CODE, {"modules": modules}, producer="developer"))
+
+        artifact = dev.execute_skill(
+            "bug_fix",
+            {"bug_reports": [{"id": "BUG-1", "description": "BILLING totals wrong"}, {"id": "BUG-2"}]},
+        )
+        fixes = artifact.content["fixes"]
+        assert fixes[0]["files_changed"] == ["app/billing/service.py"]
+        assert fixes[0]["status"] == "triaged"
+        assert fixes[1]["files_changed"] == ["app/unknown/service.py"]
+        assert artifact.content["needs_investigation"] == 1
+
+    def test_code_generation_class_names_share_one_stem(self):
+        from aise.skills.code_generation.scripts.code_generation import CodeGenerationSkill
+
+        files = CodeGenerationSkill()._generate_module_files("user_auth2", {}, [], "python")
+        model, routes, service = (f["content"] for f in files)
+        assert "class UserAuth2Model:" in model
+        assert "from .service import UserAuth2Service\n" in routes
+        assert "service = UserAuth2Service()\n" in routes
+        assert "class UserAuth2Service:" in service
@@ -150,6 +150,11 @@ class TestProductManagerAgent:
             assert "source_sfs" in req
             assert len(req["source_sfs"]) > 0
 
+        # Check traceability: every SF maps to exactly the SRs citing it
+        matrix = content["traceability_matrix"]
+        for sf_id, sr_ids in matrix.items():
+            assert sr_ids == [req["id"] for req in requirements if sf_id in req["source_sfs"]]
+
         # Check coverage
         coverage = content["coverage_summary"]
         assert coverage["coverage_percentage"] > 0
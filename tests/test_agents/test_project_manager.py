@@ -54,6 +54,32 @@ class TestProjectManagerAgent:
         assert len(resolutions) == 1
         assert resolutions[0]["status"] == "resolved"
 
+    def test_conflict_resolution_prefers_nfr_aligned_options(self, monkeypatch):
+        from aise.core.artifact import Artifact, ArtifactType
+
+        agent, store = self._make_agent()
+        nfrs = [{"description": "Must be SECURE"}, {"description": "High performance under load"}]
+        store.store(Artifact(ArtifactType.REQUIREMENTS, {"non_functional_requirements": nfrs}, producer="pm"))
+        lookups = []
+        original = store.get_latest
+        monkeypatch.setattr(store, "get_latest", lambda t: (lookups.append(t), original(t))[1])
+
+        artifact = agent.execute_skill(
+            "conflict_resolution",
+            {
+                "conflicts": [
+                    {"issue": "Cache", "options": ["Secure proxy", "Fast in-memory cache"]},
+                    {"issue": "Auth", "options": ["Secure tokens", "Sessions"]},
+                ],
+            },
+        )
+        decisions = [(r["decision"], r["rationale"]) for r in artifact.content["resolutions"]]
+        assert decisions == [
+            ("Fast in-memory cache", "Selected for performance alignment with NFRs"),
+            ("Secure tokens", "Default selection - first proposed option"),
+        ]
+        assert lookups.count(ArtifactType.REQUIREMENTS) == 1
+
     def test_progress_tracking(self):
         bus = MessageBus()
         store = ArtifactStore()
@@ -0,0 +1,122 @@
+"""Tests for the agent pool."""
+
+from aise.config import ModelConfig, ProjectConfig
+from aise.core.agent import AgentRole
+from aise.core.agent_pool import AgentPool
+from aise.core.artifact import ArtifactStore
+from aise.core.message import MessageBus
+from aise.main import create_team
+
+
+class TestAgentPool:
+    def _acquire(self, pool, bus, store, model_config=None, name="developer"):
+        from aise.agents import DeveloperAgent
+
+        cfg = model_config or ModelConfig()
+        return pool.acquire(
+            AgentRole.DEVELOPER,
+            cfg,
+            agent_name=name,
+            message_bus=bus,
+            artifact_store=store,
+            factory=lambda: DeveloperAgent(bus, store, model_config=cfg),
+        )
+
+    def test_released_agent_is_reused_and_rebound(self):
+        pool = AgentPool()
+        bus1, store1 = MessageBus(), ArtifactStore()
+        agent = self._acquire(pool, bus1, store1)
+        pool.release(agent)
+
+        bus2, store2 = MessageBus(), ArtifactStore()
+        reused = self._acquire(pool, bus2, store2)
+        assert reused is agent
+        assert reused.message_bus is bus2
+        assert reused.artifact_store is store2
+        assert pool.size == 1
+
+    def test_in_use_agent_is_not_shared(self):
+        pool = AgentPool()
+        bus, store = MessageBus(), ArtifactStore()
+        first = self._acquire(pool, bus, store)
+        second = self._acquire(pool, bus, store)
+        assert first is not second
+        assert pool.idle_count == 0
+
+    def test_different_model_config_is_not_reused(self):
+        pool = AgentPool()
+        bus, store = MessageBus(), ArtifactStore()
+        agent = self._acquire(pool, bus, store)
+        pool.release(agent)
+        other = self._acquire(pool, bus, store, ModelConfig(provider="ollama", model="codellama"))
+        assert other is not agent
+
+    def test_agent_is_subscribed_under_requested_name(self):
+        pool = AgentPool()
+        bus1, store1 = MessageBus(), ArtifactStore()
+        agent = self._acquire(pool, bus1, store1, name="developer_1")
+        assert agent.name == "developer_1"
+        assert list(bus1._subscribers) == ["developer_1"]
+        pool.release(agent)
+        assert bus1._subscribers == {}
+
+        bus2, store2 = MessageBus(), ArtifactStore()
+        self._acquire(pool, bus2, store2, name="developer")
+        assert list(bus2._subscribers) == ["developer"]
+
+    def test_max_size_limits_idle_agents_only(self):
+        pool = AgentPool(max_size=1)
+        bus, store = MessageBus(), ArtifactStore()
+        agents = [self._acquire(pool, bus, store, name=f"developer_{i}") for i in range(3)]
+        assert pool.size == 3
+        for agent in agents:
+            pool.release(agent)
+        assert pool.size == pool.idle_count == 1
+
+    def test_pool_key_ignores_extra_order_and_hides_api_key(self):
+        from aise.core.agent_pool import _pool_key
+
+        first = ModelConfig(api_key="sk-secret", extra={"a": 1, "b": 2})
+        second = ModelConfig(api_key="sk-secret", extra={"b": 2, "a": 1})
+        assert _pool_key(AgentRole.DEVELOPER, first) == _pool_key(AgentRole.DEVELOPER, second)
+        assert "sk-secret" not in repr(_pool_key(AgentRole.DEVELOPER, first))
+        other_key = ModelConfig(api_key="sk-other", extra={"a": 1, "b": 2})
+        assert _pool_key(AgentRole.DEVELOPER, first) != _pool_key(AgentRole.DEVELOPER, other_key)
+
+    def test_idle_count_tracks_acquire_release_and_eviction(self):
+        pool = AgentPool(idle_timeout=0.0)
+        bus, store = MessageBus(), ArtifactStore()
+        agent = self._acquire(pool, bus, store)
+        pool.release(agent)
+        pool.release(agent)
+        assert pool.idle_count == 1
+        assert self._acquire(pool, bus, store) is agent
+        assert pool.idle_count == 0
+        pool.release(agent)
+        pool.evict_idle()
+        assert (pool.size, pool.idle_count) == (0, 0)
+
+    def test_evict_idle(self):
+        pool = AgentPool(idle_timeout=0.0)
+        bus, store = MessageBus(), ArtifactStore()
+        pool.release(self._acquire(pool, bus, store))
+        assert pool.evict_idle() == 1
+        assert pool.size == 0
+
+    def test_create_team_draws_from_pool(self):
+        pool = AgentPool()
+        first = create_team(ProjectConfig(), agent_pool=pool)
+        for agent in first.agents.values():
+            pool.release(agent)
+        second = create_team(ProjectConfig(), agent_pool=pool)
+        assert set(id(a) for a in second.agents.values()) == set(id(a) for a in first.agents.values())
+        assert all(a.message_bus is second.message_bus for a in second.agents.values())
+
+    def test_pooled_rebuild_subscribes_agents_under_team_names(self):
+        pool = AgentPool()
+        first = create_team(ProjectConfig(), {AgentRole.DEVELOPER: 2}, agent_pool=pool)
+        for agent in first.agents.values():
+            pool.release(agent)
+        second = create_team(ProjectConfig(), {AgentRole.DEVELOPER: 1}, agent_pool=pool)
+        assert "developer" in second.agents
+        assert sorted(second.message_bus._subscribers) == sorted(second.agents)
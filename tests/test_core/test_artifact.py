@@ -60,10 +60,42 @@ class TestArtifactStore:
         assert latest is not None
         assert latest.version == 2
 
+    def test_get_latest_tracks_highest_version_regardless_of_order(self):
+        store = ArtifactStore()
+        first_v2 = Artifact(artifact_type=ArtifactType.PRD, content={}, producer="pm", version=2)
+        store.store(first_v2)
+        store.store(Artifact(artifact_type=ArtifactType.PRD, content={}, producer="pm", version=1))
+        store.store(Artifact(artifact_type=ArtifactType.PRD, content={}, producer="pm", version=2))
+        assert store.get_latest(ArtifactType.PRD) is first_v2
+
+        v3 = Artifact(artifact_type=ArtifactType.PRD, content={}, producer="pm", version=3)
+        store.store(v3)
+        assert store.get_latest(ArtifactType.PRD) is v3
+        store.clear()
+        assert store.get_latest(ArtifactType.PRD) is None
+
     def test_get_latest_none(self):
         store = ArtifactStore()
         assert store.get_latest(ArtifactType.SOURCE_CODE) is None
 
+    def test_get_latest_many(self):
+        store = ArtifactStore()
+        store.store(Artifact(artifact_type=ArtifactType.PRD, content={"v": 1}, producer="pm", version=1))
+        newest = Artifact(artifact_type=ArtifactType.PRD, content={"v": 2}, producer="pm", version=2)
+        store.store(newest)
+
+        latest = store.get_latest_many([ArtifactType.PRD, ArtifactType.SOURCE_CODE])
+        assert latest == {ArtifactType.PRD: newest, ArtifactType.SOURCE_CODE: None}
+
+    def test_store_many(self):
+        store = ArtifactStore()
+        prd = Artifact(artifact_type=ArtifactType.PRD, content={}, producer="pm")
+        code = Artifact(artifact_type=ArtifactType.SOURCE_CODE, content={}, producer="dev")
+
+        assert store.store_many((prd, code)) == [prd.id, code.id]
+        assert store.all() == [prd, code]
+        assert store.get_latest(ArtifactType.SOURCE_CODE) is code
+
     def test_all(self):
         store = ArtifactStore()
         store.store(Artifact(artifact_type=ArtifactType.REQUIREMENTS, content={}, producer="pm"))
@@ -0,0 +1,172 @@
+"""Tests for the CLI entry point helpers in ``aise.main``."""
+
+from aise.main import _build_parser
+
+
+class TestBuildParser:
+    def test_parser_is_built_once(self):
+        assert _build_parser() is _build_parser()
+
+    def test_parses_team_command(self):
+        args = _build_parser().parse_args(["team", "--verbose"])
+        assert args.command == "team"
+        assert args.verbose is True
+
+    def test_parses_run_command(self):
+        args = _build_parser().parse_args(["run", "-r", "Build a todo app", "-p", "Todo"])
+        assert args.command == "run"
+        assert args.requirements == "Build a todo app"
+        assert args.project_name == "Todo"
+        assert args.output is None
+
+    def test_github_args_shared_by_run_and_demand(self):
+        parser = _build_parser()
+        run_args = parser.parse_args(["run", "-r", "x", "--github-token", "tok"])
+        demand_args = parser.parse_args(["demand", "--github-repo-owner", "octo"])
+        assert run_args.github_token == "tok"
+        assert demand_args.github_repo_owner == "octo"
+
+    def test_github_defaults_read_from_env(self, monkeypatch):
+        from aise.main import _github_env_defaults
+
+        monkeypatch.setenv("GITHUB_REPO_NAME", "aise-demo")
+        _github_env_defaults.cache_clear()
+        _build_parser.cache_clear()
+        try:
+            args = _build_parser().parse_args(["run", "-r", "x"])
+            assert args.github_repo_name == "aise-demo"
+        finally:
+            monkeypatch.undo()
+            _github_env_defaults.cache_clear()
+            _build_parser.cache_clear()
+
+    def test_every_schema_command_is_registered(self):
+        from aise.main import _CLI_SCHEMA
+
+        help_text = _build_parser().format_help()
+        for name, *_ in _CLI_SCHEMA:
+            assert name in help_text
+
+    def test_positional_and_shared_web_url_args(self):
+        parser = _build_parser()
+        args = parser.parse_args(["abort_task", "t-1", "--web-url", "http://h:1"])
+        assert args.task_id == "t-1"
+        assert args.web_url == "http://h:1"
+        assert parser.parse_args(["active_tasks"]).web_url == "http://127.0.0.1:8000"
+
+
+class TestReadRequirementsArg:
+    def test_reads_file_contents(self, tmp_path):
+        from aise.main import _read_requirements_arg
+
+        path = tmp_path / "reqs.md"
+        path.write_text("Build a snake game", encoding="utf-8")
+        assert _read_requirements_arg(str(path)) == "Build a snake game"
+
+    def test_empty_file_reads_as_empty_text(self, tmp_path):
+        from aise.main import _read_requirements_arg
+
+        path = tmp_path / "reqs.md"
+        path.write_text("", encoding="utf-8")
+        assert _read_requirements_arg(str(path)) == ""
+
+    def test_raw_text_and_directories_pass_through(self, tmp_path):
+        from aise.main import _read_requirements_arg
+
+        assert _read_requirements_arg("Build a todo app") == "Build a todo app"
+        assert _read_requirements_arg(str(tmp_path)) == str(tmp_path)
+        assert _read_requirements_arg("") is None
+
+    def test_inline_text_skips_filesystem_probe(self, monkeypatch):
+        import os
+
+        from aise.main import _MAX_REQUIREMENTS_PATH_LEN, _read_requirements_arg
+
+        def _no_stat(path):
+            raise AssertionError(f"unexpected isfile probe: {path!r}")
+
+        monkeypatch.setattr(os.path, "isfile", _no_stat)
+        multi_line = "Build a todo app\n- add items\n- remove items"
+        long_text = "x" * _MAX_REQUIREMENTS_PATH_LEN
+        assert _read_requirements_arg(multi_line) == multi_line
+        assert _read_requirements_arg(long_text) == long_text
+
+
+class TestWriteResultsJson:
+    def test_round_trips_payload(self, tmp_path):
+        import json
+        from datetime import datetime
+
+        from aise.main import _write_results_json
+
+        out = tmp_path / "out.json"
+        _write_results_json(str(out), {"result": "完成", "task_log": [{"at": datetime(2024, 1, 1)}]})
+        data = json.loads(out.read_text(encoding="utf-8"))
+        assert data["result"] == "完成"
+        assert data["task_log"][0]["at"] == "2024-01-01 00:00:00"
+
+    def test_falls_back_to_stdlib_json_without_orjson(self, tmp_path, monkeypatch):
+        import builtins
+        import json
+
+        from aise.main import _write_results_json
+
+        real_import = builtins.__import__
+
+        def _no_orjson(name, *args, **kwargs):
+            if name == "orjson":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", _no_orjson)
+        out = tmp_path / "out.json"
+        _write_results_json(str(out), {"result": "ok", "task_log": [], "big": 2**70})
+        assert json.loads(out.read_text(encoding="utf-8")) == {"result": "ok", "task_log": [], "big": 2**70}
+
+    def test_streamed_output_matches_stdlib_json(self, tmp_path):
+        import json
+
+        from aise.main import _write_results_json
+
+        payload = {
+            "result": "line one\nline two",
+            "task_log": [
+                {"type": "task_request", "to": "developer", "payload": {"files": ["a.py", "b.py"], "n": 1}},
+                {"type": "task_response", "from": "developer", "status": "ok", "empty": {}, "items": []},
+            ],
+            "empty_log": [],
+            "nested": {"a": [1, {"b": None}]},
+        }
+        out = tmp_path / "out.json"
+        _write_results_json(str(out), payload)
+        assert out.read_text(encoding="utf-8") == json.dumps(payload, indent=2, ensure_ascii=False)
+
+        _write_results_json(str(out), {})
+        assert out.read_text(encoding="utf-8") == "{}"
+
+    def test_orjson_differences_from_stdlib_are_the_documented_ones(self, tmp_path):
+        import enum
+        import json
+
+        import pytest
+
+        pytest.importorskip("orjson")
+        from aise.main import _write_results_json
+
+        class Status(str, enum.Enum):
+            DONE = "done"
+
+        class Phase(enum.Enum):
+            DESIGN = "design"
+
+        out = tmp_path / "out.json"
+        _write_results_json(str(out), {"status": Status.DONE, "items": [{"n": 1.5, "big": 1e16}]})
+        same = {"status": Status.DONE, "items": [{"n": 1.5, "big": 1e16}]}
+        assert out.read_text(encoding="utf-8") == json.dumps(same, indent=2, ensure_ascii=False, default=str)
+
+        payload = {"scores": [float("nan"), float("inf"), 1e-7], "ratio": float("-inf"), "phase": Phase.DESIGN}
+        _write_results_json(str(out), payload)
+        expected = {"scores": [None, None, 1e-7], "ratio": None, "phase": "design"}
+        text = out.read_text(encoding="utf-8")
+        assert text == json.dumps(expected, indent=2, ensure_ascii=False).replace("1e-07", "1e-7")
+        assert "Phase.DESIGN" in json.dumps(payload, default=str)
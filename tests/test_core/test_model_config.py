@@ -704,3 +704,51 @@ class TestCreateTeamWithModelConfig:
         assert agents["developer"].model_config.provider == "ollama"
         assert agents["qa_engineer"].model_config.provider == "openai"
         assert agents["project_manager"].model_config.provider == "openai"
+
+    def test_agent_class_resolved_lazily_for_every_role(self):
+        from aise.main import _get_agent_class
+
+        assert _get_agent_class(AgentRole.ARCHITECT) is ArchitectAgent
+        assert _get_agent_class(AgentRole.DEVELOPER) is DeveloperAgent
+        for role in AgentRole:
+            assert issubclass(_get_agent_class(role), Agent)
+
+    def test_agent_class_lookup_rejects_unknown_role(self):
+        from aise.main import _get_agent_class
+
+        with pytest.raises(ValueError, match="Unknown agent role"):
+            _get_agent_class("not_a_role")
+
+    def test_create_team_skips_disabled_agents_without_constructing(self, monkeypatch):
+        import aise.main as main_module
+
+        constructed = []
+        original = main_module._get_agent_class
+
+        def _tracking_get_agent_class(role):
+            constructed.append(role)
+            return original(role)
+
+        monkeypatch.setattr(main_module, "_get_agent_class", _tracking_get_agent_class)
+        cfg = ProjectConfig(agents={"developer": AgentConfig(name="developer", enabled=False)})
+        orchestrator = create_team(cfg)
+
+        assert "developer" not in orchestrator.agents
+        assert AgentRole.DEVELOPER not in constructed
+        assert "architect" in orchestrator.agents
+
+    def test_create_team_parallel_and_serial_builds_match(self):
+        counts = {AgentRole.DEVELOPER: 3, AgentRole.QA_ENGINEER: 2, AgentRole.ARCHITECT: 1}
+        parallel = create_team(ProjectConfig(team_build_parallel=True), counts)
+        serial = create_team(ProjectConfig(team_build_parallel=False), counts)
+
+        assert list(parallel.agents) == list(serial.agents)
+        assert list(parallel.agents) == [
+            "developer_1",
+            "developer_2",
+            "developer_3",
+            "qa_engineer_1",
+            "qa_engineer_2",
+            "architect",
+        ]
+        assert all(a.message_bus is parallel.message_bus for a in parallel.agents.values())
@@ -39,6 +39,18 @@ class TestOrchestrator:
         assert orch.get_agent("dev") is agent
         assert len(orch.agents) == 1
 
+    def test_register_agents_batch(self):
+        orch = Orchestrator()
+        bus = orch.message_bus
+        store = orch.artifact_store
+        dev = Agent("dev", AgentRole.DEVELOPER, bus, store)
+        qa = Agent("qa", AgentRole.QA_ENGINEER, bus, store)
+        orch.register_agents([dev, qa])
+
+        assert orch.get_agent("dev") is dev
+        assert orch.get_agent("qa") is qa
+        assert len(orch.agents) == 2
+
     def test_get_agents_by_role(self):
         orch = Orchestrator()
         bus, store = orch.message_bus, orch.artifact_store
@@ -144,3 +144,20 @@ class TestRuntimeManagerStatus:
         manager.start()
         manager.stop()
         assert manager.get_agents_status() == []
+
+    def test_describe_agents_matches_status_without_building_llms(self, mock_create_deep_agent):
+        manager = RuntimeManager()
+        manager.start()
+        started = {s["name"]: s for s in manager.get_agents_status()}
+        manager.stop()
+
+        with patch("aise.runtime.manager._build_llm") as build_llm:
+            described = {s["name"]: s for s in RuntimeManager().describe_agents()}
+        build_llm.assert_not_called()
+
+        assert described.keys() == started.keys()
+        for name, entry in described.items():
+            assert entry["role_display"] == started[name]["role_display"]
+            assert entry["model"] == started[name]["model"]
+            assert entry["skills"] == started[name]["skills"]
+            assert entry["status"] == "standby"
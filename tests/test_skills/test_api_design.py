@@ -0,0 +1,102 @@
+"""Tests for the API design skill's contract assembly helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from aise.skills.api_design.scripts.api_design import APIDesignSkill
+
+
+class TestEndpointsAndPaths:
+    def test_paths_mirror_normalised_endpoints(self):
+        skill = APIDesignSkill()
+        endpoints = skill._normalise_endpoints(
+            [
+                {"method": "get", "path": "/items", "description": "List items", "status_codes": {200: "OK"}},
+                {"method": "POST", "path": "/items", "status_codes": {"201": "Created"}},
+                {"method": "TRACE", "path": "/items"},
+                {"method": "GET", "path": "items"},
+            ]
+        )
+        assert [(e["method"], e["path"]) for e in endpoints] == [("GET", "/items"), ("POST", "/items")]
+        assert endpoints[0]["status_codes"] == {"200": "OK"}
+        assert endpoints[1]["description"] == "POST /items"
+
+        paths = skill._build_paths_from_endpoints(endpoints)
+        assert paths["/items"]["get"] == {"summary": "List items", "responses": {"200": {"description": "OK"}}}
+        assert paths["/items"]["post"]["responses"] == {"201": {"description": "Created"}}
+        assert paths["/items"]["post"]["requestBody"]["required"] is True
+
+    def test_write_operations_get_their_own_request_body(self):
+        skill = APIDesignSkill()
+        endpoints = skill._normalise_endpoints(
+            [
+                {"method": "POST", "path": "/a", "status_codes": {"201": "Created"}},
+                {"method": "PUT", "path": "/a/{id}", "status_codes": {"200": "OK"}},
+            ]
+        )
+        paths = skill._build_paths_from_endpoints(endpoints)
+        post_body = paths["/a"]["post"]["requestBody"]
+        assert post_body == paths["/a/{id}"]["put"]["requestBody"]
+        assert post_body["content"]["application/json"]["schema"] == {"type": "object"}
+        post_body["content"]["application/json"]["schema"]["title"] = "edited"
+        assert paths["/a/{id}"]["put"]["requestBody"]["content"]["application/json"]["schema"] == {"type": "object"}
+        assert skill._build_paths_from_endpoints(endpoints)["/a"]["post"]["requestBody"]["content"] == {
+            "application/json": {"schema": {"type": "object"}}
+        }
+
+    def test_identical_responses_are_independent(self):
+        skill = APIDesignSkill()
+        endpoints = skill._normalise_endpoints(
+            [
+                {"method": "GET", "path": "/a", "status_codes": {"200": "Success", "404": "Not Found"}},
+                {"method": "DELETE", "path": "/a/{id}", "status_codes": {"204": "Success", "404": "Not Found"}},
+            ]
+        )
+        paths = skill._build_paths_from_endpoints(endpoints)
+        get_responses = paths["/a"]["get"]["responses"]
+        delete_responses = paths["/a/{id}"]["delete"]["responses"]
+        assert get_responses["404"] == delete_responses["404"] == {"description": "Not Found"}
+        assert get_responses["200"] == delete_responses["204"] == {"description": "Success"}
+        get_responses["404"]["description"] = "Gone"
+        assert delete_responses["404"] == {"description": "Not Found"}
+
+    def test_repeated_path_strings_are_shared(self):
+        rows = [
+            {"method": "GET", "path": "".join(["/items", "/{id}"]), "status_codes": {"200": "".join(["O", "K"])}},
+            {"method": "PUT", "path": "".join(["/items", "/{id}"]), "status_codes": {"200": "".join(["O", "K"])}},
+        ]
+        first, second = APIDesignSkill()._normalise_endpoints(rows)
+        assert first["path"] is second["path"]
+        assert first["status_codes"]["200"] is second["status_codes"]["200"]
+
+
+class TestServiceComponents:
+    def _context(self, content):
+        from aise.core.artifact import Artifact, ArtifactStore, ArtifactType
+        from aise.core.skill import SkillContext
+
+        store = ArtifactStore()
+        store.store(Artifact(artifact_type=ArtifactType.ARCHITECTURE_DESIGN, content=content, producer="architect"))
+        return SkillContext(artifact_store=store)
+
+    def test_filters_service_components(self):
+        components = [{"name": "Orders", "type": "service"}, {"name": "DB", "type": "infrastructure"}, "bad"]
+        context = self._context({"components": components})
+        assert APIDesignSkill._service_components(context) == [components[0]]
+
+    def test_non_list_components_yield_none(self):
+        context = self._context({"components": "n/a"})
+        assert APIDesignSkill._service_components(context) is None
+
+
+class TestParseJsonResponse:
+    def test_accepts_plain_and_fenced_json(self):
+        skill = APIDesignSkill()
+        assert skill._parse_json_response('{"endpoints": []}') == {"endpoints": []}
+        fenced = 'Here is the contract:\n```json\n{"endpoints": [{"path": "/a"}]}\n```\nDone.'
+        assert skill._parse_json_response(fenced) == {"endpoints": [{"path": "/a"}]}
+
+    def test_rejects_non_object_payloads(self):
+        with pytest.raises(RuntimeError):
+            APIDesignSkill()._parse_json_response("```\n[1, 2]\n```")
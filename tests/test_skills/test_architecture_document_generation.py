@@ -0,0 +1,138 @@
+"""Tests for the architecture document generation skill's Markdown output."""
+
+from __future__ import annotations
+
+from aise.core.artifact import Artifact, ArtifactType
+from aise.skills.architecture_document_generation.scripts.architecture_document_generation import (
+    ArchitectureDocumentGenerationSkill,
+)
+
+
+def _fn(fn_id: str, name: str, *, layer: str = "api", interfaces: int = 1) -> dict:
+    return {
+        "id": fn_id,
+        "type": "service",
+        "name": name,
+        "layer": layer,
+        "subsystem": "api_core",
+        "file_path": f"src/{layer}/{name.lower()}.py",
+        "source_ars": [],
+        "interfaces": [{"method": "GET", "path": f"/{name.lower()}", "description": "d"}] * interfaces,
+    }
+
+
+def _artifacts(fns: list[dict], layers: dict) -> tuple[Artifact, Artifact]:
+    ar = Artifact(ArtifactType.ARCHITECTURE_REQUIREMENT, {"architecture_requirements": []}, producer="architect")
+    fn = Artifact(
+        ArtifactType.FUNCTIONAL_DESIGN,
+        {"functions": fns, "architecture_layers": layers},
+        producer="architect",
+    )
+    return ar, fn
+
+
+class TestArchitectureDoc:
+    def test_api_sections_are_numbered_by_position(self, tmp_path):
+        fns = [_fn("FN-001", "Orders"), _fn("FN-002", "Empty", interfaces=0), _fn("FN-003", "Billing")]
+        path = tmp_path / "system-architecture.md"
+        ArchitectureDocumentGenerationSkill()._generate_architecture_doc(str(path), "P", *_artifacts(fns, {}))
+
+        text = path.read_text(encoding="utf-8")
+        assert "### 5.1 Orders" in text
+        assert "### 5.3 Billing" in text
+        assert "Empty\n\n**FN ID**" not in text
+
+    def test_layer_sections_keep_fixed_numbers(self, tmp_path):
+        fns = [_fn("FN-001", "Store", layer="data")]
+        path = tmp_path / "system-architecture.md"
+        layers = {"data_layer": {}, "integration_layer": {}}
+        ArchitectureDocumentGenerationSkill()._generate_architecture_doc(str(path), "P", *_artifacts(fns, layers))
+
+        text = path.read_text(encoding="utf-8")
+        assert "### 4.3 Data Layer\n\n```\ndata_layer/\n  ├── api_core/\n  │   ├── store.py (FN-001)\n" in text
+        assert "### 4.4 Integration Layer" in text
+        assert "### 4.1" not in text
+
+    def test_functions_bucketed_by_type_layer_and_subsystem(self, tmp_path):
+        fns = [
+            _fn("FN-001", "Orders"),
+            {**_fn("FN-002", "Cache", layer="data"), "type": "component", "subsystem": "cache"},
+            {**_fn("FN-003", "Repo", layer="data"), "subsystem": "storage"},
+            {**_fn("FN-004", "Index", layer="data"), "type": "component", "subsystem": "cache"},
+        ]
+        path = tmp_path / "system-architecture.md"
+        ArchitectureDocumentGenerationSkill()._generate_architecture_doc(
+            str(path), "P", *_artifacts(fns, {"data_layer": {}})
+        )
+
+        text = path.read_text(encoding="utf-8")
+        services, components = text.split("### 3.2 组件列表")
+        assert "| FN-001 |" in services and "| FN-003 |" in services and "| FN-002 |" not in services
+        assert "| FN-002 |" in components and "| FN-004 |" in components
+        assert (
+            "data_layer/\n  ├── cache/\n  │   ├── cache.py (FN-002)\n  │   ├── index.py (FN-004)\n"
+            "  ├── storage/\n  │   ├── repo.py (FN-003)\n```"
+        ) in text
+        assert "### 5.1 Orders" in text and "### 5.2" not in text
+
+    def test_traceability_rows_union_fns_across_ars(self, tmp_path):
+        ar = Artifact(
+            ArtifactType.ARCHITECTURE_REQUIREMENT,
+            {"architecture_requirements": [], "traceability_matrix": {"SR-1": ["AR-1", "AR-2"], "SR-2": ["AR-9"]}},
+            producer="architect",
+        )
+        fn_matrix = {"AR-1": ["FN-003", "FN-001"], "AR-2": ["FN-001", "FN-002"]}
+        fn = Artifact(ArtifactType.FUNCTIONAL_DESIGN, {"functions": [], "traceability_matrix": fn_matrix}, producer="a")
+        path = tmp_path / "system-architecture.md"
+        ArchitectureDocumentGenerationSkill()._generate_architecture_doc(str(path), "P", ar, fn)
+
+        text = path.read_text(encoding="utf-8")
+        assert "| SR-1 | AR-1, AR-2 | FN-001, FN-002, FN-003 |\n| SR-2 | AR-9 |  |\n" in text
+
+    def test_ars_grouped_by_layer_and_unknown_layers_skipped(self, tmp_path):
+        ars = [
+            {"id": "AR-1", "description": "a", "source_sr": "SR-1", "target_layer": "data"},
+            {"id": "AR-2", "description": "b", "source_sr": "SR-1"},
+            {"id": "AR-3", "description": "c", "source_sr": "SR-2", "target_layer": "edge"},
+        ]
+        ar = Artifact(ArtifactType.ARCHITECTURE_REQUIREMENT, {"architecture_requirements": ars}, producer="a")
+        fn = Artifact(ArtifactType.FUNCTIONAL_DESIGN, {"functions": []}, producer="a")
+        path = tmp_path / "system-architecture.md"
+        ArchitectureDocumentGenerationSkill()._generate_architecture_doc(str(path), "P", ar, fn)
+
+        text = path.read_text(encoding="utf-8")
+        assert text.index("### 2.2 业务层架构需求\n\n**AR-2**") < text.index("### 2.3 数据层架构需求\n\n**AR-1**")
+        assert "AR-3" not in text
+
+
+def _status_artifact(elements: dict) -> Artifact:
+    return Artifact(ArtifactType.STATUS_TRACKING, {"elements": elements, "summary": {}}, producer="architect")
+
+
+def _element(elem_type: str, description: str, children: tuple[str, ...] = (), status: str = "未开始") -> dict:
+    return {
+        "type": elem_type,
+        "description": description,
+        "status": status,
+        "completion_percentage": 0.0,
+        "children": list(children),
+    }
+
+
+class TestStatusDoc:
+    def test_only_long_descriptions_are_truncated(self, tmp_path):
+        elements = {
+            "SF-001": _element("system_feature", "Feature", ["SR-001"]),
+            "SR-001": _element("system_requirement", "Requirement", ["AR-001"]),
+            "AR-001": _element("architecture_requirement", "Arch", ["FN-001", "FN-002"]),
+            "FN-001": _element("function", "Short"),
+            "FN-002": _element("function", "x" * 70, status="已完成"),
+        }
+        path = tmp_path / "status.md"
+        ArchitectureDocumentGenerationSkill()._generate_status_doc(str(path), _status_artifact(elements))
+
+        text = path.read_text(encoding="utf-8")
+        assert "- **FN-001**: Short [未开始 0%] ⏸️\n" in text
+        assert f"- **FN-002**: {'x' * 60}... [已完成 0%] ✅\n" in text
+        assert f"| FN-002 | function | {'x' * 40}... | 已完成 | 0% | - |\n" in text
+        assert "| FN-001 | function | Short | 未开始 | 0% | - |\n" in text
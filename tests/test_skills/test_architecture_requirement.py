@@ -0,0 +1,80 @@
+"""Tests for the architecture requirement skill's traceability and LLM helpers."""
+
+from __future__ import annotations
+
+import pytest
+
+from aise.core.artifact import ArtifactStore
+from aise.core.skill import SkillContext
+from aise.skills.architecture_requirement.scripts.architecture_requirement import ArchitectureRequirementSkill
+
+
+class TestTraceabilityAndCoverage:
+    def test_groups_ars_by_source_sr_in_sr_order(self):
+        requirements = [{"id": "SR-0002"}, {"id": "SR-0001"}, {"id": "SR-0003"}]
+        ar_list = [
+            {"id": "AR-SR-0001-1", "source_sr": "SR-0001"},
+            {"id": "AR-SR-0002-1", "source_sr": "SR-0002"},
+            {"id": "AR-SR-0001-2", "source_sr": "SR-0001"},
+            {"id": "AR-SR-9999-1", "source_sr": "SR-9999"},
+        ]
+        skill = ArchitectureRequirementSkill()
+        matrix = skill._build_traceability_matrix(requirements, skill._group_ar_ids_by_sr(ar_list))
+        assert matrix == {
+            "SR-0002": ["AR-SR-0002-1"],
+            "SR-0001": ["AR-SR-0001-1", "AR-SR-0001-2"],
+            "SR-0003": [],
+        }
+        assert list(matrix) == ["SR-0002", "SR-0001", "SR-0003"]
+
+    def test_coverage_reuses_the_grouping(self):
+        skill = ArchitectureRequirementSkill()
+        requirements = [{"id": "SR-0001"}, {"id": "SR-0002"}]
+        ar_list = [{"id": "AR-SR-0001-1", "source_sr": "SR-0001"}, {"id": "AR-SR-0001-2", "source_sr": "SR-0001"}]
+        coverage = skill._calculate_coverage(requirements, skill._group_ar_ids_by_sr(ar_list), len(ar_list))
+        assert coverage == {
+            "total_srs": 2,
+            "covered_srs": 1,
+            "total_ars": 2,
+            "uncovered_srs": ["SR-0002"],
+            "coverage_percentage": 50.0,
+        }
+
+
+class TestNormaliseLlmArs:
+    def test_malformed_source_sr_ids_are_skipped(self):
+        requirements = [{"id": "SR-0001"}, {"id": "SR-SR-0002"}, {"id": "SR-12a"}]
+        rows = [
+            {"source_sr": "SR-SR-0002", "description": "a"},
+            {"source_sr": "SR-0001", "description": "b"},
+            {"source_sr": "SR-12a", "description": "c"},
+            {"source_sr": "SR-0001", "description": "d"},
+        ]
+        ars = ArchitectureRequirementSkill()._normalise_llm_ars(rows, requirements)
+        assert [(ar["id"], ar["description"]) for ar in ars] == [("AR-SR-0001-1", "b"), ("AR-SR-0001-2", "d")]
+
+
+class _ScriptedClient:
+    def __init__(self, *responses: str) -> None:
+        self.responses = list(responses)
+        self.calls = 0
+
+    def complete(self, messages, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class TestDecomposeWithLlm:
+    _RESPONSE = '{"architecture_requirements": [{"source_sr": "SR-0001", "target_layer": "api", "description": "x"}]}'
+
+    def test_every_run_calls_the_llm(self):
+        skill = ArchitectureRequirementSkill()
+        client = _ScriptedClient("not json", self._RESPONSE, self._RESPONSE)
+        context = SkillContext(artifact_store=ArtifactStore(), llm_client=client)
+        requirements = [{"id": "SR-0001", "type": "functional", "description": "Import"}]
+
+        with pytest.raises(RuntimeError):
+            skill._decompose_with_llm(requirements, context)
+        first = skill._decompose_with_llm(requirements, context)
+        assert skill._decompose_with_llm(requirements, context) == first
+        assert client.calls == 3
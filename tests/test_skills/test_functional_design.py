@@ -0,0 +1,89 @@
+"""Tests for the functional design skill's FN naming and layout helpers."""
+
+from __future__ import annotations
+
+from aise.skills.functional_design.scripts.functional_design import FunctionalDesignSkill
+
+
+class TestGenerateFilePath:
+    def test_pascal_case_names_become_snake_case_files(self):
+        skill = FunctionalDesignSkill()
+        assert skill._generate_file_path("api", "auth_service", "UserLoginService") == (
+            "src/api_layer/auth_service/user_login_service.py"
+        )
+        assert skill._generate_file_path("data", "repositories", "Orders") == "src/data_layer/repositories/orders.py"
+
+
+class TestDetermineSubsystem:
+    def test_keyword_priority_beats_position(self):
+        skill = FunctionalDesignSkill()
+        assert skill._determine_subsystem("users can login with sso", "api") == "auth_service"
+        assert skill._determine_subsystem("缓存订单数据", "data") == "order_management"
+        assert skill._determine_subsystem("persist product rows to the database", "data") == "product_service"
+        assert skill._determine_subsystem("cache warmup", "integration") == "cache_service"
+
+    def test_falls_back_to_layer_default(self):
+        skill = FunctionalDesignSkill()
+        assert skill._determine_subsystem("send notifications", "integration") == "external_services"
+        assert skill._determine_subsystem("send notifications", "unknown") == "common"
+
+
+class TestGenerateFunctionName:
+    def test_strips_layer_prefix_and_builds_pascal_case(self):
+        skill = FunctionalDesignSkill()
+        assert skill._generate_function_name("API层: manage user-profile data now", "service") == (
+            "ManageUserprofileDataService"
+        )
+        assert skill._generate_function_name("数据层: order storage", "component") == "OrderStorage"
+        assert skill._generate_function_name("!!! ???", "component") == "GenericComponent"
+        assert skill._generate_function_name("snake_case café-2", "component") == "SnakecaseCafé2"
+
+    def test_repeated_descriptions_are_memoised(self):
+        from aise.skills.functional_design.scripts import functional_design
+
+        functional_design._function_name.cache_clear()
+        skill = FunctionalDesignSkill()
+        for _ in range(3):
+            skill._generate_function_name("业务层: checkout cart", "service")
+        info = functional_design._function_name.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+
+class TestIndexFunctions:
+    def test_layers_matrix_and_counts_in_one_pass(self):
+        functions = [
+            {"id": "FN-SERVICE-001", "type": "service", "layer": "api", "source_ars": ["AR-1"]},
+            {"id": "FN-COM-001", "type": "component", "layer": "Data ", "source_ars": ["AR-2", "AR-1"]},
+            {"id": "FN-COM-002", "type": "component", "layer": "edge", "source_ars": ["AR-3"]},
+        ]
+        layers, matrix, type_counts = FunctionalDesignSkill()._index_functions(functions)
+        assert layers["api_layer"] == {"services": ["FN-SERVICE-001"], "components": []}
+        assert layers["data_layer"] == {"services": [], "components": ["FN-COM-001"]}
+        assert matrix == {"AR-1": ["FN-SERVICE-001", "FN-COM-001"], "AR-2": ["FN-COM-001"], "AR-3": ["FN-COM-002"]}
+        assert type(matrix) is dict
+        assert (type_counts["service"], type_counts["component"]) == (1, 2)
+
+
+class TestNormaliseLlmFunctions:
+    def test_repeated_field_values_are_shared(self):
+        ars = [{"id": "AR-1"}, {"id": "AR-2"}]
+        rows = [
+            {
+                "source_ar": "AR-1",
+                "type": "Service ",
+                "name": "A",
+                "layer": "API",
+                "subsystem": "".join(["or", "ders"]),
+            },
+            {
+                "source_ar": "AR-2",
+                "type": "service",
+                "name": "B",
+                "layer": "api ",
+                "subsystem": "".join(["ord", "ers"]),
+            },
+        ]
+        first, second = FunctionalDesignSkill()._normalise_llm_functions(rows, ars)
+        assert (first["id"], second["id"]) == ("FN-SERVICE-001", "FN-SERVICE-002")
+        for key in ("type", "layer", "subsystem", "estimated_complexity"):
+            assert first[key] is second[key]
@@ -0,0 +1,26 @@
+"""Tests for the shared skill prompt loader."""
+
+from pathlib import Path
+
+from aise.skills import _prompts
+from aise.skills.api_design.scripts import api_design
+
+
+class TestLoadPromptFile:
+    def test_prompt_files_are_read_once(self, monkeypatch):
+        _prompts.load_prompt_file.cache_clear()
+        reads = []
+        original = Path.read_text
+
+        def _counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return original(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", _counting_read_text)
+        first = _prompts.load_prompt_file(api_design.__file__, "../skill.md")
+        assert _prompts.load_prompt_file(api_design.__file__, "../skill.md") == first
+        assert first
+        assert len(reads) == 1
+
+    def test_missing_file_reads_as_empty(self):
+        assert _prompts.load_prompt_file(api_design.__file__, "../missing.md") == ""
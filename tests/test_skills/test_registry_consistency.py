@@ -41,3 +41,19 @@ def test_legacy_namespace_dirs_removed_or_non_source_only():
             continue
         py_sources = [p for p in path.rglob("*.py") if p.is_file()]
         assert py_sources == [], f"Legacy namespace dir contains source files and needs manual review: {path}"
+
+
+def test_skills_package_resolves_every_exported_class_lazily():
+    import aise.skills as skills_pkg
+
+    for name in skills_pkg.__all__:
+        cls = getattr(skills_pkg, name)
+        assert cls.__name__ == name
+        assert skills_pkg.__dict__[name] is cls
+    assert set(skills_pkg.__all__) <= set(dir(skills_pkg))
+
+
+def test_skills_all_matches_lazy_registry():
+    import aise.skills as skills_pkg
+
+    assert skills_pkg.__all__ == list(skills_pkg._LAZY)